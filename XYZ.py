@@ -7,16 +7,32 @@ import os
 import logging
 from datetime import datetime, timedelta
 import threading
+import multiprocessing
+import concurrent.futures
+import queue
 import sys
 from openpyxl import Workbook, load_workbook
 from openpyxl.styles import PatternFill, Font, Alignment, Border, Side
 from openpyxl.utils import get_column_letter, column_index_from_string
 import traceback
 import shutil
+import zipfile
+import xml.etree.ElementTree as ET
+from xml.sax.saxutils import escape as _xml_escape
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
+from collections import deque
+from functools import lru_cache
 import re
 
+# Optional faster engine for plain row dumps. openpyxl stays the
+# fallback and still handles all template work.
+try:
+    import xlsxwriter
+    HAS_XLSXWRITER = True
+except ImportError:
+    HAS_XLSXWRITER = False
+
 # Setup logging with ASCII-safe messages
 logging.basicConfig(
     level=logging.DEBUG,
@@ -28,6 +44,24 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Driver-level connection pooling: disconnect/reconnect cycles reuse the
+# pooled physical connection instead of paying a fresh handshake. True
+# is pyodbc's default, but it only takes effect when set before the
+# first connect, so pin it explicitly here.
+pyodbc.pooling = True
+
+# Cell references like B4 / AA10 (compiled once, used with fullmatch)
+_CELL_RE = re.compile(r'[A-Z]+\d+')
+
+# Memoized column letter/index conversions - pure functions over a small
+# domain, called for every cell in the export hot path
+_col_idx = lru_cache(maxsize=1024)(column_index_from_string)
+_col_ltr = lru_cache(maxsize=1024)(get_column_letter)
+
+# Shared style object - openpyxl styles are immutable, so one instance
+# can serve every merged-cell write instead of an allocation per cell
+_CENTER_ALIGNMENT = Alignment(horizontal='center', vertical='center')
+
 # ============================================================================
 # DATABASE MANAGER
 # ============================================================================
@@ -40,6 +74,7 @@ class DatabaseManager:
         self.connected = False
         self.server = None
         self.database = None
+        self._conn_str = None
     
     def connect(self, server: str, database: str, 
                 username: str = None, password: str = None,
@@ -54,9 +89,10 @@ class DatabaseManager:
                 conn_str = f"DRIVER={{SQL Server}};SERVER={server};DATABASE={database};UID={username};PWD={password};"
             
             logger.debug(f"Connection string: {conn_str}")
-            
+
             # Attempt connection
             self.connection = pyodbc.connect(conn_str)
+            self._conn_str = conn_str
             self.connected = True
             self.server = server
             self.database = database
@@ -88,6 +124,29 @@ class DatabaseManager:
             self.connected = False
             self.server = None
             self.database = None
+            self._conn_str = None
+
+    def open_connection(self):
+        """Open an extra connection for a worker thread.
+
+        One pyodbc connection cannot serve concurrent cursors, so
+        parallel fetches need a connection per worker. The caller owns
+        the returned connection and must close it.
+        """
+        if not self._conn_str:
+            raise RuntimeError("Not connected to a database")
+        return pyodbc.connect(self._conn_str)
+
+    def ping(self) -> Tuple[bool, str]:
+        """Cheap liveness check on the existing connection"""
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("SELECT 1")
+            cursor.fetchone()
+            cursor.close()
+            return True, "Connection successful"
+        except Exception as e:
+            return False, str(e)
     
     def get_tables(self) -> List[str]:
         """Get list of tables in the database"""
@@ -113,10 +172,10 @@ class DatabaseManager:
             logger.error(f"Error getting tables: {e}")
             raise
     
-    def get_table_columns(self, table_name: str) -> List[str]:
+    def get_table_columns(self, table_name: str, connection=None) -> List[str]:
         """Get column names for a specific table"""
         try:
-            cursor = self.connection.cursor()
+            cursor = (connection or self.connection).cursor()
             
             # Query to get column names
             query = f"""
@@ -170,10 +229,10 @@ class DatabaseManager:
             logger.error(f"Error getting batches from {table_name}: {e}")
             return []
     
-    def get_time_columns(self, table_name: str) -> List[str]:
+    def get_time_columns(self, table_name: str, connection=None) -> List[str]:
         """Get time-related columns from a table"""
         try:
-            columns = self.get_table_columns(table_name)
+            columns = self.get_table_columns(table_name, connection=connection)
             time_columns = []
             
             # Look for time-related columns
@@ -189,9 +248,9 @@ class DatabaseManager:
             logger.error(f"Error getting time columns from {table_name}: {e}")
             return []
     
-    def fetch_filtered_data(self, table_name: str, batch_name: str = None, 
+    def fetch_filtered_data(self, table_name: str, batch_name: str = None,
                           start_time: datetime = None, end_time: datetime = None,
-                          limit: int = None) -> Dict:
+                          limit: int = None, connection=None) -> Dict:
         """Fetch data from a table with filters for batch and time range - VALUES ONLY, NO COLUMN NAMES"""
         try:
             logger.info(f"[FETCH] Fetching filtered data from table: {table_name}")
@@ -204,7 +263,7 @@ class DatabaseManager:
             # Don't get columns from DB - template will provide column positions
             
             # We need to get columns temporarily to build WHERE clause
-            temp_columns = self.get_table_columns(table_name)
+            temp_columns = self.get_table_columns(table_name, connection=connection)
             
             # Build WHERE clause for filters
             where_clauses = []
@@ -255,7 +314,7 @@ class DatabaseManager:
                 query += " WHERE " + " AND ".join(where_clauses)
             
             # Add order by time if available
-            time_columns = self.get_time_columns(table_name)
+            time_columns = self.get_time_columns(table_name, connection=connection)
             if time_columns:
                 query += f" ORDER BY [{time_columns[0]}]"
             
@@ -263,28 +322,34 @@ class DatabaseManager:
             logger.debug(f"Parameters: {params}")
             
             # Execute query
-            cursor = self.connection.cursor()
+            cursor = (connection or self.connection).cursor()
+            # Stream rows in driver-sized batches instead of fetchall -
+            # peak memory then holds one batch of driver rows plus the
+            # converted lists, not two full copies of the table
+            cursor.arraysize = 10000
             cursor.execute(query, params)
-            
-            # Fetch all rows - JUST RAW DATA VALUES, NO COLUMN NAMES
-            rows = cursor.fetchall()
-            row_count = len(rows)
-            
+
             # Convert to list of lists - PURE VALUES ONLY, NO COLUMN NAMES
             data = []
-            for row in rows:
-                row_list = []
-                for value in row:
-                    # Handle None values
-                    if value is None:
-                        value = ""
-                    # Handle datetime objects
-                    elif isinstance(value, datetime):
-                        value = value.strftime('%Y-%m-%d %H:%M:%S')
-                    # Convert everything to string (but keep empty strings as "")
-                    row_list.append(str(value) if value is not None else "")
-                data.append(row_list)
-            
+            while True:
+                rows = cursor.fetchmany(10000)
+                if not rows:
+                    break
+                for row in rows:
+                    row_list = []
+                    for value in row:
+                        # Handle None values
+                        if value is None:
+                            row_list.append("")
+                        # Handle datetime objects
+                        elif isinstance(value, datetime):
+                            row_list.append(value.strftime('%Y-%m-%d %H:%M:%S'))
+                        # Convert everything else to string
+                        else:
+                            row_list.append(str(value))
+                    data.append(row_list)
+            row_count = len(data)
+
             cursor.close()
             
             # Log sample data (just values)
@@ -485,10 +550,19 @@ class SimplePositionDialog:
             cb = ttk.Checkbutton(cb_frame, text=sheet, variable=var)
             cb.pack(anchor='w')
         
-        # Configure scrolling
-        def on_frame_configure(event):
+        # Configure scrolling - debounced, since every packed child fires
+        # <Configure> and bbox("all") visits every child
+        pending_sr = [None]
+
+        def update_scrollregion():
+            pending_sr[0] = None
             self.sheet_canvas.configure(scrollregion=self.sheet_canvas.bbox("all"))
-        
+
+        def on_frame_configure(event):
+            if pending_sr[0] is not None:
+                self.dialog.after_cancel(pending_sr[0])
+            pending_sr[0] = self.dialog.after(50, update_scrollregion)
+
         self.sheet_checkbox_frame.bind("<Configure>", on_frame_configure)
         
         # Control buttons for sheets
@@ -659,10 +733,19 @@ class SheetSelectionDialog:
             cb = ttk.Checkbutton(cb_frame, text=sheet, variable=var)
             cb.pack(anchor='w')
         
-        # Configure scrolling
-        def on_frame_configure(event):
+        # Configure scrolling - debounced, since every packed child fires
+        # <Configure> and bbox("all") visits every child
+        pending_sr = [None]
+
+        def update_scrollregion():
+            pending_sr[0] = None
             canvas.configure(scrollregion=canvas.bbox("all"))
-        
+
+        def on_frame_configure(event):
+            if pending_sr[0] is not None:
+                self.dialog.after_cancel(pending_sr[0])
+            pending_sr[0] = self.dialog.after(50, update_scrollregion)
+
         sheet_frame.bind("<Configure>", on_frame_configure)
         
         # Control buttons
@@ -798,11 +881,13 @@ class PositionMappingDialog:
         self.preview_vars = {}
         self.apply_type_vars = {}  # "all", "this", "select"
         self.selected_sheets_vars = {}  # For "select" option
-        
+        self._pending_previews = {}  # column -> after() id for debounce
+        self._last_preview = {}  # column -> last validated (cell, sheet, apply) state
+
         # Create mapping rows
         header_frame = ttk.Frame(mapping_frame)
         header_frame.pack(fill='x', pady=(0, 10))
-        
+
         columns = [
             ("Database Column", 20),
             ("Sheet", 15),
@@ -811,85 +896,42 @@ class PositionMappingDialog:
             ("Sheets Selected", 20),
             ("Preview", 25)
         ]
-        
+
         for i, (text, width) in enumerate(columns):
-            ttk.Label(header_frame, text=text, width=width, 
+            ttk.Label(header_frame, text=text, width=width,
                      font=('Arial', 10, 'bold')).grid(row=0, column=i, padx=5)
-        
-        # Create rows for each database column
-        for i, column in enumerate(self.db_columns, 1):
-            row_frame = ttk.Frame(mapping_frame)
-            row_frame.pack(fill='x', pady=2)
-            
-            # Database column name
-            ttk.Label(row_frame, text=column, width=20).grid(row=0, column=0, padx=5)
-            
-            # Sheet dropdown
-            sheet_var = tk.StringVar(value=self.template_sheets[0] if self.template_sheets else "")
-            sheet_cb = ttk.Combobox(row_frame, textvariable=sheet_var, 
-                                   values=self.template_sheets, width=15, state="readonly")
-            sheet_cb.grid(row=0, column=1, padx=5)
-            self.sheet_vars[column] = sheet_var
-            
-            # Cell reference entry
-            cell_var = tk.StringVar()
-            cell_entry = ttk.Entry(row_frame, textvariable=cell_var, width=10)
-            cell_entry.grid(row=0, column=2, padx=5)
-            self.cell_vars[column] = cell_var
-            
-            # Apply type dropdown
-            apply_var = tk.StringVar(value="this")  # "all", "this", "select"
-            apply_cb = ttk.Combobox(row_frame, textvariable=apply_var, 
-                                   values=["All Sheets", "This Sheet Only", "Select Sheets"], 
-                                   width=15, state="readonly")
-            apply_cb.grid(row=0, column=3, padx=5)
-            self.apply_type_vars[column] = apply_var
-            
-            # Select sheets button (initially disabled)
-            select_btn = ttk.Button(row_frame, text="Select Sheets...", 
-                                   command=lambda col=column: self.select_sheets(col),
-                                   width=15, state='disabled')
-            select_btn.grid(row=0, column=4, padx=5)
-            self.selected_sheets_vars[column] = {
-                'button': select_btn,
-                'selected': [self.template_sheets[0]] if self.template_sheets else []
-            }
-            
-            # Preview label
-            preview_var = tk.StringVar(value="Not mapped")
-            ttk.Label(row_frame, textvariable=preview_var, width=25).grid(row=0, column=5, padx=5)
-            self.preview_vars[column] = preview_var
-            
-            # Add validation and event handlers
-            def on_change(col_name, *args):
-                self.update_preview(col_name)
-                # Enable/disable select sheets button
-                apply_type = self.apply_type_vars[col_name].get()
-                if apply_type == "Select Sheets":
-                    self.selected_sheets_vars[col_name]['button'].config(state='normal')
-                else:
-                    self.selected_sheets_vars[col_name]['button'].config(state='disabled')
-            
-            # Use trace_add
-            cell_var.trace_add('write', lambda name, index, mode, col=column: on_change(col))
-            sheet_var.trace_add('write', lambda name, index, mode, col=column: on_change(col))
-            apply_var.trace_add('write', lambda name, index, mode, col=column: on_change(col))
-        
-        # Configure scrolling
-        def on_frame_configure(event):
+
+        # Build rows in small deferred batches so dialog open time does not
+        # scale with the column count - only the first screenful is built
+        # before the window appears, the rest fills in on idle ticks
+        self.mapping_frame = mapping_frame
+        self._pending_columns = deque(self.db_columns)
+        self._build_row_batch()
+
+        # Configure scrolling - debounced. Each mapping-row batch fires a
+        # burst of <Configure> events, and bbox("all") visits every
+        # child, so recomputing per event made population O(n^2)
+        pending_sr = [None]
+
+        def update_scrollregion():
+            pending_sr[0] = None
             canvas.configure(scrollregion=canvas.bbox("all"))
-        
+
+        def on_frame_configure(event):
+            if pending_sr[0] is not None:
+                self.dialog.after_cancel(pending_sr[0])
+            pending_sr[0] = self.dialog.after(50, update_scrollregion)
+
         mapping_frame.bind("<Configure>", on_frame_configure)
-        
-        # Safe mouse wheel binding
+
+        # Mouse wheel: sign check instead of float divide + try/except per
+        # tick; the binding dies with the canvas so no TclError race remains
         def on_mousewheel(event):
-            try:
-                canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-            except tk.TclError:
-                pass
-        
+            canvas.yview_scroll(-1 if event.delta > 0 else 1, "units")
+
         canvas.bind("<MouseWheel>", on_mousewheel)
-        
+        canvas.bind("<Destroy>", lambda e: canvas.unbind("<MouseWheel>"))
+
         # Buttons
         btn_frame = ttk.Frame(main_frame)
         btn_frame.pack(fill='x', pady=20)
@@ -900,7 +942,111 @@ class PositionMappingDialog:
         
         # Clean up on close
         self.dialog.protocol("WM_DELETE_WINDOW", self.cancel)
-    
+
+    # Rows created per idle tick while filling the mapping list
+    ROW_BATCH_SIZE = 25
+
+    # Retired StringVars kept for the next dialog - registering a fresh
+    # Tcl variable per widget is surprisingly costly for wide tables
+    _var_pool: List[tk.StringVar] = []
+
+    def _pooled_var(self, value: str = "") -> tk.StringVar:
+        """Reuse a StringVar from the pool, or allocate a new one"""
+        if PositionMappingDialog._var_pool:
+            var = PositionMappingDialog._var_pool.pop()
+            var.set(value)
+            return var
+        return tk.StringVar(value=value)
+
+    def _release_vars(self):
+        """Return this dialog's StringVars to the shared pool"""
+        for vars_by_column in (self.sheet_vars, self.cell_vars,
+                               self.apply_type_vars, self.preview_vars):
+            PositionMappingDialog._var_pool.extend(vars_by_column.values())
+            vars_by_column.clear()
+
+    def _build_row_batch(self):
+        """Create the next batch of mapping rows, then yield to the event loop"""
+        if not self.dialog.winfo_exists():
+            return
+
+        for _ in range(self.ROW_BATCH_SIZE):
+            if not self._pending_columns:
+                return
+            self._create_mapping_row(self._pending_columns.popleft())
+
+        if self._pending_columns:
+            self.dialog.after_idle(self._build_row_batch)
+
+    def _create_mapping_row(self, column: str):
+        """Create the widget row for one database column"""
+        row_frame = ttk.Frame(self.mapping_frame)
+        row_frame.pack(fill='x', pady=2)
+
+        # Database column name
+        ttk.Label(row_frame, text=column, width=20).grid(row=0, column=0, padx=5)
+
+        # Sheet dropdown
+        sheet_var = self._pooled_var(self.template_sheets[0] if self.template_sheets else "")
+        sheet_cb = ttk.Combobox(row_frame, textvariable=sheet_var,
+                               values=self.template_sheets, width=15, state="readonly")
+        sheet_cb.grid(row=0, column=1, padx=5)
+        self.sheet_vars[column] = sheet_var
+
+        # Cell reference entry
+        cell_var = self._pooled_var()
+        cell_entry = ttk.Entry(row_frame, textvariable=cell_var, width=10)
+        cell_entry.grid(row=0, column=2, padx=5)
+        self.cell_vars[column] = cell_var
+
+        # Apply type dropdown
+        apply_var = self._pooled_var("this")  # "all", "this", "select"
+        apply_cb = ttk.Combobox(row_frame, textvariable=apply_var,
+                               values=["All Sheets", "This Sheet Only", "Select Sheets"],
+                               width=15, state="readonly")
+        apply_cb.grid(row=0, column=3, padx=5)
+        self.apply_type_vars[column] = apply_var
+
+        # Select sheets button (initially disabled)
+        select_btn = ttk.Button(row_frame, text="Select Sheets...",
+                               command=lambda col=column: self.select_sheets(col),
+                               width=15, state='disabled')
+        select_btn.grid(row=0, column=4, padx=5)
+        self.selected_sheets_vars[column] = {
+            'button': select_btn,
+            'selected': [self.template_sheets[0]] if self.template_sheets else []
+        }
+
+        # Preview label
+        preview_var = self._pooled_var("Not mapped")
+        ttk.Label(row_frame, textvariable=preview_var, width=25).grid(row=0, column=5, padx=5)
+        self.preview_vars[column] = preview_var
+
+        # Debounced validation - one binding per widget instead of three
+        # live Tcl traces per row firing on every keystroke
+        cell_entry.bind('<KeyRelease>', lambda e, col=column: self._schedule_preview(col))
+        sheet_cb.bind('<<ComboboxSelected>>', lambda e, col=column: self._schedule_preview(col))
+        apply_cb.bind('<<ComboboxSelected>>', lambda e, col=column: self._schedule_preview(col))
+
+    def _schedule_preview(self, column: str):
+        """Coalesce bursts of input into one preview update after 50 ms"""
+        pending = self._pending_previews.get(column)
+        if pending is not None:
+            self.dialog.after_cancel(pending)
+        self._pending_previews[column] = self.dialog.after(
+            50, lambda: self._run_preview(column))
+
+    def _run_preview(self, column: str):
+        """Run the debounced validation for one column"""
+        self._pending_previews.pop(column, None)
+        self.update_preview(column)
+
+        # Enable/disable select sheets button
+        if self.apply_type_vars[column].get() == "Select Sheets":
+            self.selected_sheets_vars[column]['button'].config(state='normal')
+        else:
+            self.selected_sheets_vars[column]['button'].config(state='disabled')
+
     def select_sheets(self, column_name: str):
         """Open sheet selection dialog for a specific column"""
         # Pass self.dialog as parent (it's a tkinter widget)
@@ -911,16 +1057,24 @@ class PositionMappingDialog:
         selected = dialog.get_selected_sheets()
         if selected:
             self.selected_sheets_vars[column_name]['selected'] = selected
+            # Sheet list changed even though the vars did not - force a refresh
+            self._last_preview.pop(column_name, None)
             self.update_preview(column_name)
-    
+
     def update_preview(self, column_name: str):
         """Update preview for a column"""
         cell_val = self.cell_vars[column_name].get().strip().upper()
         sheet_val = self.sheet_vars[column_name].get()
         apply_type = self.apply_type_vars[column_name].get()
-        
+
+        # Unchanged input - skip the regex and StringVar rewrite
+        state = (cell_val, sheet_val, apply_type)
+        if self._last_preview.get(column_name) == state:
+            return
+        self._last_preview[column_name] = state
+
         if cell_val:
-            if re.match(r'^[A-Z]+\d+$', cell_val):
+            if _CELL_RE.fullmatch(cell_val):
                 if apply_type == "All Sheets":
                     self.preview_vars[column_name].set(f"Will write to {cell_val} on ALL sheets")
                 elif apply_type == "This Sheet Only":
@@ -942,32 +1096,41 @@ class PositionMappingDialog:
     def apply_mappings(self):
         """Apply all mappings"""
         self.mappings = {}
-        
-        for column in self.db_columns:
-            sheet = self.sheet_vars[column].get()
-            cell = self.cell_vars[column].get().strip().upper()
-            apply_type = self.apply_type_vars[column].get()
-            selected_sheets = self.selected_sheets_vars[column]['selected']
-            
+
+        # Snapshot the Tcl-side state in one pass; validation below then
+        # runs in pure Python without further round-trips per column
+        # (rows not built yet by the deferred batches are skipped)
+        entries = [
+            (column,
+             self.sheet_vars[column].get(),
+             self.cell_vars[column].get().strip().upper(),
+             self.apply_type_vars[column].get(),
+             self.selected_sheets_vars[column]['selected'])
+            for column in self.db_columns if column in self.cell_vars
+        ]
+
+        # Flat dispatch instead of a per-column if/elif chain; unknown
+        # values fall through to the "All Sheets" default like before
+        target_dispatch = {
+            "Select Sheets": lambda sheet, selected: selected,
+            "This Sheet Only": lambda sheet, selected: [sheet],
+            "All Sheets": lambda sheet, selected: self.template_sheets,
+        }
+
+        for column, sheet, cell, apply_type, selected_sheets in entries:
             if sheet and cell:
                 # Validate cell format
-                if re.match(r'^[A-Z]+\d+$', cell):
+                if _CELL_RE.fullmatch(cell):
                     # Determine apply settings
                     apply_all = (apply_type == "All Sheets")
-                    
-                    # For "Select Sheets", use the selected sheets
-                    target_sheets = []
-                    if apply_type == "Select Sheets":
-                        if not selected_sheets:
-                            messagebox.showerror("No Sheets Selected", 
-                                               f"No sheets selected for {column}. Please select sheets.")
-                            return
-                        target_sheets = selected_sheets
-                    elif apply_type == "This Sheet Only":
-                        target_sheets = [sheet]
-                    else:  # All Sheets
-                        target_sheets = self.template_sheets
-                    
+
+                    target_sheets = target_dispatch.get(
+                        apply_type, target_dispatch["All Sheets"])(sheet, selected_sheets)
+                    if apply_type == "Select Sheets" and not target_sheets:
+                        messagebox.showerror("No Sheets Selected",
+                                           f"No sheets selected for {column}. Please select sheets.")
+                        return
+
                     self.mappings[column] = (sheet, cell, apply_all, target_sheets)
                 else:
                     messagebox.showerror("Invalid Cell", 
@@ -979,15 +1142,18 @@ class PositionMappingDialog:
             if messagebox.askyesno("No Mappings", 
                                   "No columns have been mapped. Continue anyway?"):
                 self.result = {}
+                self._release_vars()
                 self.dialog.destroy()
             return
         else:
             self.result = self.mappings
+            self._release_vars()
             self.dialog.destroy()
-    
+
     def cancel(self):
         """Cancel mapping"""
         self.result = None
+        self._release_vars()
         self.dialog.destroy()
     
     def get_mappings(self) -> Optional[Dict]:
@@ -1000,17 +1166,76 @@ class PositionMappingDialog:
 
 class ExcelTableExporter:
     """Handles exporting tables to Excel with position mapping and merged cell support"""
-    
+
+    # id(ws) -> {(row, col): (top_left_row, top_left_col)} for merged cells
+    _merge_index_cache: Dict[int, Dict[Tuple[int, int], Tuple[int, int]]] = {}
+    # merge-range signature -> shared index, so template sheets with the
+    # same layout (the common case) build the cell map only once
+    _merge_sig_cache: Dict[Tuple, Dict[Tuple[int, int], Tuple[int, int]]] = {}
+
+    # Templates up to this size are loaded in memory without the disk copy
+    DIRECT_LOAD_MAX_BYTES = 25 * 1024 * 1024
+
+    # Dumps at least this large serialize in a worker process; smaller
+    # ones are not worth the pickling round trip
+    SUBPROCESS_ROW_THRESHOLD = 50_000
+
+    @staticmethod
+    def _get_merge_index(ws) -> Dict[Tuple[int, int], Tuple[int, int]]:
+        """Build (or reuse) the cell -> merged-top-left index for a sheet"""
+        index = ExcelTableExporter._merge_index_cache.get(id(ws))
+        if index is None:
+            signature = tuple(sorted(
+                (r.min_row, r.min_col, r.max_row, r.max_col)
+                for r in ws.merged_cells.ranges))
+
+            index = ExcelTableExporter._merge_sig_cache.get(signature)
+            if index is None:
+                index = {}
+                for min_row, min_col, max_row, max_col in signature:
+                    top_left = (min_row, min_col)
+                    for row in range(min_row, max_row + 1):
+                        for col in range(min_col, max_col + 1):
+                            index[(row, col)] = top_left
+                ExcelTableExporter._merge_sig_cache[signature] = index
+
+            ExcelTableExporter._merge_index_cache[id(ws)] = index
+        return index
+
+    @staticmethod
+    def _clear_merge_index():
+        """Drop cached merge indexes (call when merges change or a new workbook loads)"""
+        ExcelTableExporter._merge_index_cache.clear()
+        ExcelTableExporter._merge_sig_cache.clear()
+
     @staticmethod
     def export_tables_to_excel(tables_data: Dict, output_path: str) -> bool:
         """Export multiple tables to new Excel file"""
+        # Fastest path first: emit the worksheet XML ourselves (no Cell
+        # objects at all), then the streaming library engines as fallback.
+        # Big dumps serialize in a child process so the CPU-bound XML work
+        # does not contend for the GIL with the Tk thread and any fetches.
+        total_rows = sum(len(t.get('data', ()))
+                         for t in tables_data.values() if t.get('success', False))
         try:
-            wb = Workbook()
-            
-            # Remove default sheet
-            if wb.sheetnames:
-                wb.remove(wb.active)
-            
+            if total_rows >= ExcelTableExporter.SUBPROCESS_ROW_THRESHOLD:
+                with concurrent.futures.ProcessPoolExecutor(max_workers=1) as pool:
+                    return pool.submit(_fast_xml_export_worker,
+                                       tables_data, output_path).result()
+            return ExcelTableExporter.export_tables_fast_xml(tables_data, output_path)
+        except Exception as e:
+            logger.warning(f"Fast XML export failed, falling back to library engine: {e}")
+
+        # Plain row dumps need no template handling, so they can take the
+        # faster xlsxwriter engine when it is installed
+        if HAS_XLSXWRITER:
+            return ExcelTableExporter._export_tables_xlsxwriter(tables_data, output_path)
+
+        try:
+            # Write-only mode streams rows to disk instead of building the
+            # full cell graph in memory (no default sheet to remove)
+            wb = Workbook(write_only=True)
+
             # Create a sheet for each table
             for table_name, table_data in tables_data.items():
                 if table_data.get('success', False):
@@ -1030,7 +1255,149 @@ class ExcelTableExporter:
             logger.error(f"[ERROR] Excel export error: {e}")
             logger.error(traceback.format_exc())
             raise
-    
+
+    @staticmethod
+    def _export_tables_xlsxwriter(tables_data: Dict, output_path: str) -> bool:
+        """Bulk dump through xlsxwriter - constant_memory flushes each
+        finished row to disk, so memory stays flat regardless of row count"""
+        try:
+            wb = xlsxwriter.Workbook(output_path, {
+                'constant_memory': True,
+                'strings_to_formulas': False,
+                'strings_to_urls': False,
+            })
+            try:
+                # xlsxwriter raises DuplicateWorksheetName where openpyxl
+                # auto-renames, so keep names unique (case-insensitively,
+                # matching Excel's rules) ourselves
+                seen_names = set()
+                for table_name, table_data in tables_data.items():
+                    if not table_data.get('success', False):
+                        continue
+
+                    sheet_name = ExcelTableExporter.get_valid_sheet_name(table_data['display_name'])
+                    base, n = sheet_name, 1
+                    while sheet_name.lower() in seen_names:
+                        n += 1
+                        sheet_name = f"{base[:28]}_{n}"
+                    seen_names.add(sheet_name.lower())
+                    ws = wb.add_worksheet(sheet_name)
+                    write_row = ws.write_row
+                    for r, row in enumerate(table_data['data']):
+                        write_row(r, 0, row)
+            finally:
+                wb.close()
+
+            logger.info(f"[OK] Excel file created: {output_path}")
+            return True
+
+        except Exception as e:
+            logger.error(f"[ERROR] Excel export error: {e}")
+            logger.error(traceback.format_exc())
+            raise
+
+    # Rows buffered per write into the ZIP stream of the fast XML path
+    _XML_FLUSH_ROWS = 1000
+
+    # XML 1.0 forbids most C0 controls and the surrogate range, and
+    # escape() passes them through untouched - openpyxl rejects the same
+    # set with IllegalCharacterError, so strip them before writing
+    _XML_ILLEGAL_RE = re.compile(
+        '[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff]')
+
+    @staticmethod
+    def export_tables_fast_xml(tables_data: Dict, output_path: str) -> bool:
+        """
+        Write the XLSX package directly with zipfile - no Cell objects,
+        no library layer. Only suitable for the unstyled new-workbook
+        dump: numbers are stored natively, everything else becomes an
+        inline string.
+        """
+        sheets = []  # (sheet_name, rows)
+        seen_names = set()
+        for table_name, table_data in tables_data.items():
+            if not table_data.get('success', False):
+                continue
+            sheet_name = ExcelTableExporter.get_valid_sheet_name(table_data['display_name'])
+            # Keep names unique inside the workbook - case-insensitively,
+            # matching Excel's rules and the xlsxwriter paths
+            base, n = sheet_name, 1
+            while sheet_name.lower() in seen_names:
+                n += 1
+                sheet_name = f"{base[:28]}_{n}"
+            seen_names.add(sheet_name.lower())
+            sheets.append((sheet_name, table_data['data']))
+
+        with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zf:
+            overrides = "".join(
+                f'<Override PartName="/xl/worksheets/sheet{i}.xml" '
+                'ContentType="application/vnd.openxmlformats-officedocument.'
+                'spreadsheetml.worksheet+xml"/>'
+                for i in range(1, len(sheets) + 1)
+            )
+            zf.writestr('[Content_Types].xml',
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+                '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+                '<Default Extension="xml" ContentType="application/xml"/>'
+                '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+                f'{overrides}</Types>')
+            zf.writestr('_rels/.rels',
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+                '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+                '</Relationships>')
+            # Quotes must be entity-escaped inside the name="..." attribute
+            attr_entities = {'"': '&quot;'}
+            sheet_tags = "".join(
+                f'<sheet name="{_xml_escape(name, attr_entities)}" sheetId="{i}" r:id="rId{i}"/>'
+                for i, (name, _) in enumerate(sheets, start=1)
+            )
+            zf.writestr('xl/workbook.xml',
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+                'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+                f'<sheets>{sheet_tags}</sheets></workbook>')
+            rel_tags = "".join(
+                f'<Relationship Id="rId{i}" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet{i}.xml"/>'
+                for i in range(1, len(sheets) + 1)
+            )
+            zf.writestr('xl/_rels/workbook.xml.rels',
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+                f'{rel_tags}</Relationships>')
+
+            flush_rows = ExcelTableExporter._XML_FLUSH_ROWS
+            illegal_sub = ExcelTableExporter._XML_ILLEGAL_RE.sub
+            for i, (name, rows) in enumerate(sheets, start=1):
+                with zf.open(f'xl/worksheets/sheet{i}.xml', 'w',
+                             force_zip64=True) as stream:
+                    stream.write(
+                        b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                        b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+                        b'<sheetData>')
+                    buf = []
+                    for r, row in enumerate(rows, start=1):
+                        cells = []
+                        for value in row:
+                            if value is None:
+                                cells.append('<c/>')
+                            elif type(value) in (int, float):
+                                cells.append(f'<c><v>{value!r}</v></c>')
+                            else:
+                                cells.append(
+                                    f'<c t="inlineStr"><is><t>{_xml_escape(illegal_sub("", str(value)))}</t></is></c>')
+                        buf.append(f'<row r="{r}">{"".join(cells)}</row>')
+                        if len(buf) >= flush_rows:
+                            stream.write("".join(buf).encode('utf-8'))
+                            buf.clear()
+                    if buf:
+                        stream.write("".join(buf).encode('utf-8'))
+                    stream.write(b'</sheetData></worksheet>')
+
+        logger.info(f"[OK] Excel file created: {output_path}")
+        return True
+
     @staticmethod
     def export_tables_to_template(tables_data: Dict, template_path: str, 
                                 table_configs: Dict[str, TableConfig],
@@ -1056,30 +1423,56 @@ class ExcelTableExporter:
             if total_rows == 0:
                 logger.warning("[WARNING] No data found to export!")
             
-            # Make a copy of the template
-            logger.info("[COPY] Copying template...")
-            shutil.copy2(template_path, output_path)
-            
-            # Load the copied template
-            logger.info("[LOAD] Loading template workbook...")
-            wb = load_workbook(output_path)
+            # Small templates are loaded straight from the source file -
+            # the final wb.save(output_path) writes the copy anyway, so the
+            # copy2 + reload round trip is redundant disk I/O. Big templates
+            # keep the copy path to avoid doubling peak memory.
+            if os.path.getsize(template_path) <= ExcelTableExporter.DIRECT_LOAD_MAX_BYTES:
+                logger.info("[LOAD] Loading template workbook directly...")
+                wb = load_workbook(template_path, keep_vba=template_path.lower().endswith('.xlsm'),
+                                   keep_links=False)
+            else:
+                # Make a copy of the template
+                logger.info("[COPY] Copying template...")
+                shutil.copy2(template_path, output_path)
+
+                # Load the copied template
+                logger.info("[LOAD] Loading template workbook...")
+                wb = load_workbook(output_path)
             logger.info(f"[SHEETS] Workbook sheets: {wb.sheetnames}")
-            
-            # Apply user merge rules first (optional)
+
+            # Indexes from any previous export are stale for this workbook
+            ExcelTableExporter._clear_merge_index()
+
+            # Resolve each worksheet once - Workbook.__getitem__ walks the
+            # sheet list on every lookup, which adds up across cell writes.
+            # The dict also doubles as the O(1) sheet-name membership test.
+            sheet_cache = {name: wb[name] for name in wb.sheetnames}
+
+            # Apply user merge rules first (optional). Parse every rule up
+            # front (partition avoids split's list allocation, rules
+            # without '!' drop out), grouped by sheet so each worksheet is
+            # resolved once and its ranges merged in one run.
             if merge_rules:
                 logger.info(f"Applying {len(merge_rules)} merge rules")
+                rules_by_sheet: Dict[str, List[str]] = {}
                 for rule in merge_rules:
-                    try:
-                        if "!" in rule:
-                            sheet_name, cell_range = rule.split("!", 1)
-                            sheet_name = sheet_name.strip()
-                            cell_range = cell_range.strip()
-                            if sheet_name in wb.sheetnames:
-                                wb[sheet_name].merge_cells(cell_range)
-                                logger.info(f"[OK] Merged {sheet_name}!{cell_range}")
-                    except Exception as e:
-                        logger.warning(f"Failed to apply merge rule '{rule}': {e}")
-            
+                    sheet_name, sep, cell_range = rule.partition('!')
+                    if sep:
+                        rules_by_sheet.setdefault(sheet_name.strip(), []).append(cell_range.strip())
+
+                for sheet_name, cell_ranges in rules_by_sheet.items():
+                    ws = sheet_cache.get(sheet_name)
+                    if ws is None:
+                        logger.warning(f"Merge rules skipped - sheet '{sheet_name}' not in template")
+                        continue
+                    for cell_range in cell_ranges:
+                        try:
+                            ws.merge_cells(cell_range)
+                            logger.info(f"[OK] Merged {sheet_name}!{cell_range}")
+                        except Exception as e:
+                            logger.warning(f"Failed to apply merge rule '{sheet_name}!{cell_range}': {e}")
+
             # Process each table
             for table_name, table_data in tables_data.items():
                 logger.info("-"*40)
@@ -1109,44 +1502,50 @@ class ExcelTableExporter:
                         
                         if table_data['data'] and len(table_data['data']) > 0:
                             first_row = table_data['data'][0]  # First data row (VALUES ONLY)
-                            
-                            for column_name, cell_mapping in table_config.column_mappings.items():
+
+                            # Table-level sheet choices do not vary per column -
+                            # resolve them once before the loop
+                            all_sheet_names = wb.sheetnames
+                            table_selected_sheets = (
+                                [s for s in table_config.selected_sheets if s in sheet_cache]
+                                if table_config.selected_sheets else None
+                            )
+
+                            # column_mappings is in DB column order, so the
+                            # enumerate index doubles as the data-row position
+                            for column_index, (column_name, cell_mapping) in enumerate(
+                                    table_config.column_mappings.items()):
                                 logger.debug(f"Mapping column: {column_name}")
-                                
-                                # Find which position this column is in the data
-                                # The column_mappings should be in the same order as DB columns
-                                # So we can use the index of column_name in column_mappings keys
-                                column_index = list(table_config.column_mappings.keys()).index(column_name)
-                                
+
                                 # Get value from first row
                                 value = ""
                                 if column_index < len(first_row):
                                     value = first_row[column_index]
-                                
+
                                 logger.debug(f"Value for {column_name}: {value}")
-                                
+
                                 # Determine which sheets to write to
-                                sheets_to_write = []
                                 if cell_mapping.apply_to_all_sheets or table_config.apply_to_all_sheets:
                                     # Write to all sheets
-                                    sheets_to_write = wb.sheetnames
+                                    sheets_to_write = all_sheet_names
                                 elif cell_mapping.selected_sheets:
                                     # Write to selected sheets
-                                    sheets_to_write = [s for s in cell_mapping.selected_sheets if s in wb.sheetnames]
-                                elif table_config.selected_sheets:
+                                    sheets_to_write = [s for s in cell_mapping.selected_sheets if s in sheet_cache]
+                                elif table_selected_sheets is not None:
                                     # Write to table's selected sheets
-                                    sheets_to_write = [s for s in table_config.selected_sheets if s in wb.sheetnames]
-                                else:
+                                    sheets_to_write = table_selected_sheets
+                                elif cell_mapping.template_sheet in sheet_cache:
                                     # Write to specific sheet only
-                                    if cell_mapping.template_sheet in wb.sheetnames:
-                                        sheets_to_write = [cell_mapping.template_sheet]
+                                    sheets_to_write = [cell_mapping.template_sheet]
+                                else:
+                                    sheets_to_write = []
                                 
-                                # Write to each sheet
+                                # Write to each sheet (cached worksheet objects)
                                 for sheet_name in sheets_to_write:
                                     success = ExcelTableExporter.write_to_cell_safe(
-                                        wb, 
-                                        sheet_name, 
-                                        cell_mapping.template_cell, 
+                                        wb,
+                                        sheet_name,
+                                        cell_mapping.template_cell,
                                         value
                                     )
                                     
@@ -1173,14 +1572,14 @@ class ExcelTableExporter:
                     if table_config.apply_to_all_sheets:
                         sheets_to_write = wb.sheetnames
                     elif table_config.selected_sheets:
-                        sheets_to_write = [s for s in table_config.selected_sheets if s in wb.sheetnames]
+                        sheets_to_write = [s for s in table_config.selected_sheets if s in sheet_cache]
                     else:
-                        if table_config.sheet_name in wb.sheetnames:
+                        if table_config.sheet_name in sheet_cache:
                             sheets_to_write = [table_config.sheet_name]
                     
                     for sheet_name in sheets_to_write:
-                        ws = wb[sheet_name]
-                        start_col_idx = column_index_from_string(table_config.start_col)
+                        ws = sheet_cache[sheet_name]
+                        start_col_idx = _col_idx(table_config.start_col)
                         
                         # Find first safe row
                         safe_row = ExcelTableExporter.find_safe_row_for_table(ws, table_config.start_row)
@@ -1192,15 +1591,20 @@ class ExcelTableExporter:
                         # Write data (PURE VALUES ONLY - no column names)
                         logger.info(f"Writing {len(table_data['data'])} data rows (VALUES ONLY)")
                         data_rows = table_data['data']  # This is a list of lists - PURE VALUES ONLY
+                        # Dense region fast path: write straight through
+                        # ws.cell unless the target sits in a merged range
+                        merge_index = ExcelTableExporter._get_merge_index(ws)
+                        ws_cell = ws.cell
                         for row_idx, row_data in enumerate(data_rows, start=0):  # Start from 0 to write at start row
+                            cell_row = safe_row + row_idx  # Start writing at the start row
                             for col_idx, value in enumerate(row_data, start=0):
                                 cell_col = start_col_idx + col_idx
-                                cell_row = safe_row + row_idx  # Start writing at the start row
-                                cell_ref = f"{get_column_letter(cell_col)}{cell_row}"
-                                
-                                ExcelTableExporter.write_to_cell_safe(
-                                    wb, sheet_name, cell_ref, value
-                                )
+                                if (cell_row, cell_col) not in merge_index:
+                                    ws_cell(row=cell_row, column=cell_col, value=value)
+                                else:
+                                    ExcelTableExporter._write_ws_rc_safe(
+                                        ws, cell_row, cell_col, value
+                                    )
                             
                             # Log progress every 10 rows
                             if row_idx % 10 == 0 and row_idx > 0:
@@ -1228,65 +1632,70 @@ class ExcelTableExporter:
         Safely write to a cell, handling merged cells.
         Returns True if successful, False if cell is in a merged range.
         """
+        # Parse the reference once, then use the integer-coordinate path
+        col_letter = ''.join([c for c in cell_ref if c.isalpha()])
+        digits = ''.join([c for c in cell_ref if c.isdigit()])
+
+        # Validate cell reference
+        if not col_letter or not digits:
+            logger.warning(f"Invalid cell reference: {cell_ref}")
+            return False
+
+        return ExcelTableExporter.write_rc_safe(
+            wb, sheet_name, int(digits), _col_idx(col_letter), value)
+
+    @staticmethod
+    def write_rc_safe(wb, sheet_name: str, row: int, col: int, value: Any) -> bool:
+        """
+        Write by integer coordinates, redirecting merged cells to their
+        top-left cell. No string parsing in the hot path.
+        """
+        if sheet_name not in wb.sheetnames:
+            logger.warning(f"Sheet '{sheet_name}' not found in workbook")
+            return False
+
+        return ExcelTableExporter._write_ws_rc_safe(wb[sheet_name], row, col, value)
+
+    @staticmethod
+    def _write_ws_rc_safe(ws, row: int, col: int, value: Any) -> bool:
+        """Hot-path write against an already-resolved worksheet"""
         try:
-            if sheet_name not in wb.sheetnames:
-                logger.warning(f"Sheet '{sheet_name}' not found in workbook")
-                return False
-            
-            ws = wb[sheet_name]
-            
-            # Parse cell reference
-            col_letter = ''.join([c for c in cell_ref if c.isalpha()])
-            row_num = int(''.join([c for c in cell_ref if c.isdigit()]))
-            
-            # Validate cell reference
-            if not col_letter or not row_num:
-                logger.warning(f"Invalid cell reference: {cell_ref}")
-                return False
-            
-            col_num = column_index_from_string(col_letter)
-            
-            # Check if cell is part of a merged range
-            for merged_range in ws.merged_cells.ranges:
-                if (merged_range.min_row <= row_num <= merged_range.max_row and
-                    merged_range.min_col <= col_num <= merged_range.max_col):
-                    # Cell is in a merged range
-                    # Try to write to the top-left cell of the merged range
-                    top_left_cell = f"{get_column_letter(merged_range.min_col)}{merged_range.min_row}"
-                    try:
-                        ws[top_left_cell] = value
-                        # Center alignment for merged cells
-                        ws[top_left_cell].alignment = Alignment(horizontal='center', vertical='center')
-                        logger.debug(f"[WRITE] Wrote to merged cell {top_left_cell} (original: {cell_ref})")
-                        return True
-                    except Exception as e:
-                        logger.warning(f"Failed to write to merged cell {top_left_cell}: {e}")
-                        return False
-            
+            # Merged-cell check is an O(1) index lookup
+            top_left = ExcelTableExporter._get_merge_index(ws).get((row, col))
+            if top_left is not None:
+                # Cell is in a merged range - write to its top-left cell
+                try:
+                    cell = ws.cell(row=top_left[0], column=top_left[1], value=value)
+                    # Center alignment for merged cells
+                    cell.alignment = _CENTER_ALIGNMENT
+                    logger.debug(f"[WRITE] Wrote to merged cell {cell.coordinate} (original: row {row}, col {col})")
+                    return True
+                except Exception as e:
+                    logger.warning(f"Failed to write to merged cell at {top_left}: {e}")
+                    return False
+
             # Cell is not merged, write normally
-            ws[cell_ref] = value
-            logger.debug(f"[WRITE] Wrote to cell {cell_ref}")
+            ws.cell(row=row, column=col, value=value)
             return True
-            
+
         except Exception as e:
-            logger.error(f"[ERROR] Error writing to cell {sheet_name}!{cell_ref}: {e}")
+            logger.error(f"[ERROR] Error writing to cell {ws.title}!R{row}C{col}: {e}")
             return False
-    
+
     @staticmethod
     def find_safe_row_for_table(ws, start_row: int) -> int:
         """Find a safe row to start table data (not in merged cells)"""
+        # Rows blocked by merges touching the first 5 columns, computed once
+        bad_rows = set()
+        for merged_range in ws.merged_cells.ranges:
+            if merged_range.min_col <= 5:
+                bad_rows.update(range(merged_range.min_row, merged_range.max_row + 1))
+
         current_row = start_row
-        
-        # Check if start row is safe (not in merged cells in first 5 columns)
-        for col in range(1, 6):  # Check first 5 columns
-            cell_ref = f"{get_column_letter(col)}{current_row}"
-            for merged_range in ws.merged_cells.ranges:
-                if cell_ref in merged_range:
-                    # Row is in merged range, try next row
-                    current_row += 1
-                    logger.debug(f"Row {current_row-1} is in merged range, trying row {current_row}")
-                    return ExcelTableExporter.find_safe_row_for_table(ws, current_row)
-        
+        while current_row in bad_rows:
+            logger.debug(f"Row {current_row} is in merged range, trying row {current_row + 1}")
+            current_row += 1
+
         return current_row
     
     @staticmethod
@@ -1310,8 +1719,30 @@ class ExcelTableExporter:
     @staticmethod
     def add_table_to_sheet(ws, table_data: Dict):
         """Add a table to Excel sheet - NOT USED FOR TEMPLATE EXPORTS"""
-        # For new Excel files only - template exports don't use this
-        pass
+        rows = table_data['data']
+
+        # Track column widths first - write-only sheets need dimensions set
+        # before any row is appended. Rows are scanned in place, not copied.
+        max_len = []
+        for row in rows:
+            if len(row) > len(max_len):
+                max_len.extend([0] * (len(row) - len(max_len)))
+            for i, value in enumerate(row):
+                length = 0 if value is None else len(str(value))
+                if length > max_len[i]:
+                    max_len[i] = length
+
+        for i, width in enumerate(max_len, start=1):
+            ws.column_dimensions[_col_ltr(i)].width = min(width + 2, 50)
+
+        # ws.append is openpyxl's fast path - no per-cell coordinate
+        # handling, and it takes the fetched row sequences as-is
+        for row in rows:
+            ws.append(row)
+
+def _fast_xml_export_worker(tables_data: Dict, output_path: str) -> bool:
+    """Module-level entry point so ProcessPoolExecutor can pickle it"""
+    return ExcelTableExporter.export_tables_fast_xml(tables_data, output_path)
 
 # ============================================================================
 # FILTER DIALOG FOR BATCH AND TIME RANGE (FIXED)
@@ -1495,22 +1926,41 @@ class MultiTableExporterApp:
         
         # Table selection and configuration
         self.selected_tables = []
-        self.table_checkboxes = {}
         self.table_configs = {}  # table_name -> TableConfig
         
         # Template
         self.template_path = None
+        self.template_basename = None
         self.template_sheets = []
+        self.template_sheet_set = set()
         
         # Filters
         self.filters = {}  # table_name -> filter settings
-        
+
         # Merge rules
         self.merge_rules = []
+
+        # Session-scoped column metadata cache - table columns do not
+        # change while we are connected, so one INFORMATION_SCHEMA round
+        # trip per table is enough
+        self._column_cache: Dict[str, List[str]] = {}
+
+        # Pending after() id for the debounced selection-count update
+        self._pending_count_update = None
+
+        # Log lines queued by worker threads, appended by the Tk thread
+        self.log_queue = queue.Queue()
+
+        # Last state set per action button (id(button) -> state), so
+        # redundant config(state=...) calls can be skipped
+        self._button_states: Dict[int, str] = {}
         
         # Setup UI
         self.setup_ui()
-        
+
+        # Start the periodic log drain once the log widget exists
+        self.root.after(100, self._drain_log_queue)
+
         # Bind window close
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
     
@@ -1608,31 +2058,21 @@ class MultiTableExporterApp:
         self.filters_label = ttk.Label(control_frame, text="No filters set", font=('Arial', 9), foreground="blue")
         self.filters_label.pack(side=tk.RIGHT, padx=10)
         
-        # Create scrollable canvas for tables
-        canvas = tk.Canvas(main_frame, highlightthickness=0)
-        scrollbar = ttk.Scrollbar(main_frame, orient="vertical", command=canvas.yview)
-        self.checkbox_container = ttk.Frame(canvas)
-        
-        canvas.pack(side=tk.LEFT, fill='both', expand=True)
+        # Table list - a single Treeview stays fast for thousands of
+        # tables, unlike one Checkbutton widget per row where Tk re-runs
+        # layout on every addition
+        self.table_tree = ttk.Treeview(main_frame, columns=('selected',),
+                                       show='tree headings', selectmode='none')
+        self.table_tree.heading('#0', text='Table')
+        self.table_tree.heading('selected', text='Selected')
+        self.table_tree.column('selected', width=80, anchor='center', stretch=False)
+        scrollbar = ttk.Scrollbar(main_frame, orient="vertical", command=self.table_tree.yview)
+
+        self.table_tree.pack(side=tk.LEFT, fill='both', expand=True)
         scrollbar.pack(side=tk.RIGHT, fill='y')
-        
-        canvas.configure(yscrollcommand=scrollbar.set)
-        canvas.create_window((0, 0), window=self.checkbox_container, anchor="nw")
-        
-        # Configure scrolling
-        def on_frame_configure(event):
-            canvas.configure(scrollregion=canvas.bbox("all"))
-        
-        self.checkbox_container.bind("<Configure>", on_frame_configure)
-        
-        # Safe mouse wheel binding
-        def on_mousewheel(event):
-            try:
-                canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-            except tk.TclError:
-                pass
-        
-        canvas.bind("<MouseWheel>", on_mousewheel)
+
+        self.table_tree.configure(yscrollcommand=scrollbar.set)
+        self.table_tree.bind('<Button-1>', self.on_table_click)
         
         # Navigation buttons at the bottom
         nav_frame = ttk.Frame(main_frame)
@@ -1808,8 +2248,8 @@ class MultiTableExporterApp:
                     self.log("[OK] Database connected successfully", 'success')
                     
                     # Enable next step button
-                    self.next_step_btn.config(state='normal')
-                    
+                    self._set_button_state(self.next_step_btn, 'normal')
+
                     # Show success message and navigate to next tab
                     self.root.after(0, lambda: self.show_connection_success())
                 else:
@@ -1840,15 +2280,22 @@ class MultiTableExporterApp:
             self.status_bar.config(text="Testing connection...")
             
             try:
-                success, message = self.db.connect(
-                    server=self.server_var.get(),
-                    database=self.database_var.get(),
-                    use_windows_auth=True
-                )
-                
+                if self.db.connected:
+                    # Already connected: one SELECT 1 round trip proves
+                    # liveness without a fresh login handshake
+                    success, message = self.db.ping()
+                else:
+                    success, message = self.db.connect(
+                        server=self.server_var.get(),
+                        database=self.database_var.get(),
+                        use_windows_auth=True
+                    )
+                    if success:
+                        # Returns the physical connection to the pool
+                        self.db.disconnect()
+
                 if success:
                     self.status_bar.config(text="Connection test successful")
-                    self.db.disconnect()
                     messagebox.showinfo("Connection Test", "Connection successful!")
                     self.log("Connection test successful", 'success')
                 else:
@@ -1881,13 +2328,13 @@ class MultiTableExporterApp:
                     self.log("[OK] Database connected successfully", 'success')
                     
                     # Enable next step button
-                    self.next_step_btn.config(state='normal')
-                    
+                    self._set_button_state(self.next_step_btn, 'normal')
+
                     # Enable other buttons
-                    self.filter_btn.config(state='normal')
+                    self._set_button_state(self.filter_btn, 'normal')
                     if self.template_path:
-                        self.config_btn.config(state='normal')
-                        self.template_export_btn.config(state='normal')
+                        self._set_button_state(self.config_btn, 'normal')
+                        self._set_button_state(self.template_export_btn, 'normal')
                         
                 else:
                     self.status_bar.config(text=f"Connection failed: {message}")
@@ -1911,12 +2358,13 @@ class MultiTableExporterApp:
             self.selected_count_label.config(text="0 tables selected")
             self.filters_label.config(text="No filters set")
             self.filters.clear()
+            self._column_cache.clear()
             
             # Disable next step button and other buttons
-            self.next_step_btn.config(state='disabled')
-            self.filter_btn.config(state='disabled')
-            self.config_btn.config(state='disabled')
-            self.template_export_btn.config(state='disabled')
+            self._set_button_state(self.next_step_btn, 'disabled')
+            self._set_button_state(self.filter_btn, 'disabled')
+            self._set_button_state(self.config_btn, 'disabled')
+            self._set_button_state(self.template_export_btn, 'disabled')
             
             self.log("[DISCONNECT] Disconnected from database", 'info')
         except Exception as e:
@@ -1930,8 +2378,9 @@ class MultiTableExporterApp:
         
         def refresh():
             self.status_bar.config(text="Loading tables...")
-            
+
             try:
+                self._column_cache.clear()
                 tables = self.db.get_tables()
                 self.create_table_checkboxes(tables)
                 self.status_bar.config(text=f"Loaded {len(tables)} tables")
@@ -1943,62 +2392,97 @@ class MultiTableExporterApp:
         
         threading.Thread(target=refresh, daemon=True).start()
     
+    # Checkbox glyphs for the 'selected' column of the table Treeview
+    CHECKED = '☑'
+    UNCHECKED = '☐'
+
+    def on_table_click(self, event):
+        """Toggle table selection when a row is clicked"""
+        item = self.table_tree.identify_row(event.y)
+        if item:
+            checked = self.table_tree.set(item, 'selected') == self.CHECKED
+            self.table_tree.set(item, 'selected',
+                                self.UNCHECKED if checked else self.CHECKED)
+            self._schedule_count_update()
+
+    def _schedule_count_update(self):
+        """Coalesce rapid toggles into one recount after 50 ms"""
+        if self._pending_count_update is not None:
+            self.root.after_cancel(self._pending_count_update)
+        self._pending_count_update = self.root.after(50, self._run_count_update)
+
+    def _run_count_update(self):
+        self._pending_count_update = None
+        self.update_selected_count()
+
     def create_table_checkboxes(self, tables: List[str]):
-        """Create checkboxes for table selection"""
-        # Clear existing checkboxes
+        """Populate the table list - one Treeview row per table"""
         self.clear_table_checkboxes()
-        self.table_checkboxes.clear()
-        
-        # Create new checkboxes
-        for i, table in enumerate(tables):
-            var = tk.BooleanVar(value=False)
-            self.table_checkboxes[table] = var
-            
-            cb_frame = ttk.Frame(self.checkbox_container)
-            cb_frame.pack(fill='x', padx=5, pady=2)
-            
-            cb = ttk.Checkbutton(cb_frame, text=table, variable=var,
-                                command=self.update_selected_count)
-            cb.pack(anchor='w')
-        
+
+        # Treeview item inserts do not trigger the per-row layout passes
+        # that packing child widgets did, so the whole list is filled in
+        # one go with a single redraw at idle - no detach/reattach dance
+        tree = self.table_tree
+        for table in tables:
+            tree.insert('', 'end', iid=table, text=table, values=(self.UNCHECKED,))
+
         self.update_selected_count()
-    
+
     def clear_table_checkboxes(self):
-        """Clear all table checkboxes"""
-        for widget in self.checkbox_container.winfo_children():
-            widget.destroy()
-    
+        """Clear the table list"""
+        self.table_tree.delete(*self.table_tree.get_children())
+
     def select_all_tables(self):
         """Select all tables"""
-        for var in self.table_checkboxes.values():
-            var.set(True)
+        tree = self.table_tree
+        for item in tree.get_children():
+            tree.set(item, 'selected', self.CHECKED)
         self.update_selected_count()
         self.log("[OK] Selected all tables", 'info')
-    
+
     def clear_all_tables(self):
         """Clear all table selections"""
-        for var in self.table_checkboxes.values():
-            var.set(False)
+        tree = self.table_tree
+        for item in tree.get_children():
+            tree.set(item, 'selected', self.UNCHECKED)
         self.update_selected_count()
         self.log("[CLEAR] Cleared all table selections", 'info')
-    
+
     def update_selected_count(self):
         """Update selected tables count"""
-        self.selected_tables = [table for table, var in self.table_checkboxes.items() if var.get()]
+        # A direct call supersedes any pending debounced one
+        if self._pending_count_update is not None:
+            self.root.after_cancel(self._pending_count_update)
+            self._pending_count_update = None
+
+        tree = self.table_tree
+        self.selected_tables = [item for item in tree.get_children()
+                                if tree.set(item, 'selected') == self.CHECKED]
         count = len(self.selected_tables)
         self.selected_count_label.config(text=f"{count} table{'s' if count != 1 else ''} selected")
-        
+
         # Enable/disable buttons based on selection
         if self.selected_tables:
-            self.filter_btn.config(state='normal')
+            self._set_button_state(self.filter_btn, 'normal')
             if self.template_path:
-                self.config_btn.config(state='normal')
-                self.template_export_btn.config(state='normal')
+                self._set_button_state(self.config_btn, 'normal')
+                self._set_button_state(self.template_export_btn, 'normal')
         else:
-            self.filter_btn.config(state='disabled')
-            self.config_btn.config(state='disabled')
+            self._set_button_state(self.filter_btn, 'disabled')
+            self._set_button_state(self.config_btn, 'disabled')
             if not self.template_path:
-                self.template_export_btn.config(state='disabled')
+                self._set_button_state(self.template_export_btn, 'disabled')
+
+    def _set_button_state(self, button, state: str):
+        """Reconfigure a button only when its state actually changes.
+
+        config(state=...) triggers a style recompute even for the same
+        value, and update_selected_count runs on every toggle.
+        """
+        key = id(button)
+        if self._button_states.get(key) != state:
+            button.config(state=state)
+            self._button_states[key] = state
     
     def set_filters(self):
         """Set filters for selected tables"""
@@ -2038,6 +2522,18 @@ class MultiTableExporterApp:
         
         threading.Thread(target=get_batches, daemon=True).start()
     
+    @staticmethod
+    def _read_template_sheets(filename: str) -> List[str]:
+        """Read sheet names straight out of the XLSX package.
+
+        Only xl/workbook.xml (a ~1 KB part) is parsed, instead of
+        letting openpyxl load styles, shared strings and link caches
+        for the whole template just to list its sheets.
+        """
+        with zipfile.ZipFile(filename) as zf:
+            root = ET.fromstring(zf.read('xl/workbook.xml'))
+        return [s.get('name') for s in root.findall('.//{*}sheets/{*}sheet')]
+
     def select_template(self):
         """Select an Excel template file"""
         filetypes = [("Excel files", "*.xlsx *.xls"), ("All files", "*.*")]
@@ -2045,38 +2541,84 @@ class MultiTableExporterApp:
         
         if filename:
             self.template_path = filename
-            self.template_label.config(text=os.path.basename(filename))
-            
+            # Computed once at selection time; reused by labels, logs and
+            # any later validation instead of re-deriving
+            self.template_basename = os.path.basename(filename)
+            self.template_label.config(text=self.template_basename)
+
             # Get sheet names from template
             try:
-                wb = load_workbook(filename, read_only=True)
-                self.template_sheets = wb.sheetnames
+                try:
+                    self.template_sheets = self._read_template_sheets(filename)
+                except (zipfile.BadZipFile, KeyError, ET.ParseError):
+                    # Not a plain XLSX package - let openpyxl have a go
+                    wb = load_workbook(filename, read_only=True, keep_links=False)
+                    self.template_sheets = wb.sheetnames
                 sheet_info = f"{len(self.template_sheets)} sheets: {', '.join(self.template_sheets[:3])}"
                 if len(self.template_sheets) > 3:
                     sheet_info += f" (+{len(self.template_sheets)-3} more)"
                 self.template_info_label.config(text=sheet_info)
-                
-                self.log(f"[OK] Template selected: {os.path.basename(filename)} with {len(self.template_sheets)} sheets", 'success')
+
+                self.log(f"[OK] Template selected: {self.template_basename} with {len(self.template_sheets)} sheets", 'success')
             except Exception as e:
                 self.log(f"[ERROR] Error reading template: {str(e)}", 'error')
                 self.template_sheets = []
                 self.template_info_label.config(text="")
+            # O(1) membership tests for sheet-name validation
+            self.template_sheet_set = set(self.template_sheets)
             
             # Enable buttons if tables are selected
             if self.selected_tables:
-                self.config_btn.config(state='normal')
-                self.template_export_btn.config(state='normal')
+                self._set_button_state(self.config_btn, 'normal')
+                self._set_button_state(self.template_export_btn, 'normal')
     
     def clear_template(self):
         """Clear the selected template"""
         self.template_path = None
+        self.template_basename = None
         self.template_sheets = []
+        self.template_sheet_set = set()
         self.template_label.config(text="No template selected")
         self.template_info_label.config(text="")
-        self.config_btn.config(state='disabled')
-        self.template_export_btn.config(state='disabled')
+        self._set_button_state(self.config_btn, 'disabled')
+        self._set_button_state(self.template_export_btn, 'disabled')
         self.log("[CLEAR] Template cleared", 'info')
     
+    # SheetName!A1:B4 - one compiled pattern shared by every parse
+    _MERGE_RULE_RE = re.compile(r'[^!]+![A-Za-z]+\d+:[A-Za-z]+\d+')
+
+    # Tables matching these use the simple start-position dialog and
+    # need no column metadata
+    SIMPLE_TABLE_KEYWORDS = ('BACKGROUND', 'BATCH', 'DATA')
+
+    def _parse_merge_rules(self) -> List[str]:
+        """Read and validate merge rules from the text box.
+
+        Malformed lines are logged and dropped here, where recovery is
+        cheap, instead of surfacing as a failure deep inside the
+        exporter after the data has already been fetched.
+        """
+        try:
+            merge_text = self.merge_rules_text.get("1.0", tk.END)
+        except tk.TclError:
+            return []
+
+        rules = []
+        for line in merge_text.splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            if not self._MERGE_RULE_RE.fullmatch(line):
+                self.log(f"[WARNING] Ignoring invalid merge rule: {line}", 'warning')
+                continue
+            # O(1) lookup against the template's sheet-name set
+            sheet = line.split('!', 1)[0]
+            if self.template_sheet_set and sheet not in self.template_sheet_set:
+                self.log(f"[WARNING] Ignoring merge rule for unknown sheet: {line}", 'warning')
+                continue
+            rules.append(line)
+        return rules
+
     def configure_positions(self):
         """Configure position mappings for selected tables"""
         if not self.selected_tables:
@@ -2092,28 +2634,51 @@ class MultiTableExporterApp:
             return
         
         # Get merge rules from text box
-        try:
-            merge_text = self.merge_rules_text.get("1.0", tk.END).strip()
-            self.merge_rules = [line.strip() for line in merge_text.splitlines() if line.strip()]
-            if self.merge_rules:
-                self.log(f"Added {len(self.merge_rules)} merge rules", 'info')
-        except:
-            self.merge_rules = []
-        
+        self.merge_rules = self._parse_merge_rules()
+        if self.merge_rules:
+            self.log(f"Added {len(self.merge_rules)} merge rules", 'info')
+        
+        # Prefetch column metadata for all mapping dialogs in parallel,
+        # so the user is not left waiting on a serial round trip between
+        # dialogs. Results land in the session cache the loop reads.
+        pending = [t for t in self.selected_tables
+                   if t not in self._column_cache and not
+                   any(keyword in t.upper() for keyword in self.SIMPLE_TABLE_KEYWORDS)]
+        if len(pending) > 1:
+            def prefetch_columns(table):
+                connection = self.db.open_connection()
+                try:
+                    return self.db.get_table_columns(table, connection=connection)
+                finally:
+                    connection.close()
+
+            with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=min(8, len(pending))) as executor:
+                futures = {executor.submit(prefetch_columns, t): t for t in pending}
+                for future in concurrent.futures.as_completed(futures):
+                    try:
+                        self._column_cache[futures[future]] = future.result()
+                    except Exception as e:
+                        # The serial path below will retry and report it
+                        logger.warning(f"Column prefetch failed for {futures[future]}: {e}")
+
         # Configure each selected table
         for table_name in self.selected_tables:
             # Check if this is BACKGROUND_DATA or BATCH_DATA type table
-            is_simple_table = any(keyword in table_name.upper() for keyword in 
-                                 ['BACKGROUND', 'BATCH', 'DATA'])
+            is_simple_table = any(keyword in table_name.upper() for keyword in
+                                 self.SIMPLE_TABLE_KEYWORDS)
             
             if is_simple_table:
                 # Use simple position dialog for BACKGROUND_DATA and BATCH_DATA
                 self.configure_simple_table_position(table_name)
             else:
                 # Use column mapping dialog for other tables (like HEADER)
-                # First, get DB columns for mapping
+                # First, get DB columns for mapping (cached per session)
                 try:
-                    db_columns = self.db.get_table_columns(table_name)
+                    db_columns = self._column_cache.get(table_name)
+                    if db_columns is None:
+                        db_columns = self.db.get_table_columns(table_name)
+                        self._column_cache[table_name] = db_columns
                     self.configure_table_with_column_mappings(table_name, db_columns)
                 except Exception as e:
                     self.log(f"[ERROR] Could not get columns for {table_name}: {e}", 'error')
@@ -2197,55 +2762,55 @@ class MultiTableExporterApp:
     
     def update_mapping_display(self):
         """Update position mapping display"""
-        self.mapping_text.delete(1.0, tk.END)
-        
         if not self.table_configs:
-            self.mapping_text.insert(1.0, "No position mappings configured yet.\n\n")
-            self.mapping_text.insert(tk.END, "Click 'Configure Position Mappings' to set up mappings.")
+            self.mapping_text.delete(1.0, tk.END)
+            self.mapping_text.insert(1.0, "No position mappings configured yet.\n\n"
+                                          "Click 'Configure Position Mappings' to set up mappings.")
             return
-        
-        self.mapping_text.insert(tk.END, "POSITION MAPPINGS CONFIGURED\n")
-        self.mapping_text.insert(tk.END, "="*60 + "\n\n")
-        
+
+        # Build the whole report in Python and hand it to the Text widget
+        # in one insert - per-line inserts each reflow the widget
+        parts = ["POSITION MAPPINGS CONFIGURED\n", "="*60 + "\n\n"]
+
         # Show merge rules
         if self.merge_rules:
-            self.mapping_text.insert(tk.END, "Merge Rules:\n")
+            parts.append("Merge Rules:\n")
             for rule in self.merge_rules:
-                self.mapping_text.insert(tk.END, f"  • {rule}\n")
-            self.mapping_text.insert(tk.END, "\n")
-        
+                parts.append(f"  • {rule}\n")
+            parts.append("\n")
+
         # Show table mappings
         for table_name, config in self.table_configs.items():
-            self.mapping_text.insert(tk.END, f"[TABLE] {config.display_name}\n")
-            
+            parts.append(f"[TABLE] {config.display_name}\n")
+
             # Check if this is a simple table or header table
             is_simple_table = config.start_row > 0 and config.start_col
-            
+
             if is_simple_table:
                 # Show simple position info
-                self.mapping_text.insert(tk.END, f"   Type: Data Table (BACKGROUND/BATCH)\n")
-                self.mapping_text.insert(tk.END, f"   Start Position: {config.start_col}{config.start_row}\n")
-                
+                parts.append("   Type: Data Table (BACKGROUND/BATCH)\n")
+                parts.append(f"   Start Position: {config.start_col}{config.start_row}\n")
+
                 if config.apply_to_all_sheets:
-                    self.mapping_text.insert(tk.END, f"   Apply to: All Sheets\n")
+                    parts.append("   Apply to: All Sheets\n")
                 elif config.selected_sheets:
                     sheets = config.selected_sheets
                     if len(sheets) <= 3:
-                        self.mapping_text.insert(tk.END, f"   Apply to: {', '.join(sheets)}\n")
+                        parts.append(f"   Apply to: {', '.join(sheets)}\n")
                     else:
-                        self.mapping_text.insert(tk.END, f"   Apply to: {', '.join(sheets[:3])} +{len(sheets)-3} more\n")
+                        parts.append(f"   Apply to: {', '.join(sheets[:3])} +{len(sheets)-3} more\n")
                 else:
-                    self.mapping_text.insert(tk.END, f"   Apply to: {config.sheet_name}\n")
-                
-                self.mapping_text.insert(tk.END, f"   Values will be inserted starting at this position\n")
-                self.mapping_text.insert(tk.END, f"   Template headers remain AS IS\n")
+                    parts.append(f"   Apply to: {config.sheet_name}\n")
+
+                parts.append("   Values will be inserted starting at this position\n")
+                parts.append("   Template headers remain AS IS\n")
             else:
                 # Show column mapping info
-                self.mapping_text.insert(tk.END, f"   Type: Header/Static Data\n")
-                self.mapping_text.insert(tk.END, f"   Total Mappings: {len(config.column_mappings)}\n")
-                
+                parts.append("   Type: Header/Static Data\n")
+                parts.append(f"   Total Mappings: {len(config.column_mappings)}\n")
+
                 if config.column_mappings:
-                    self.mapping_text.insert(tk.END, "   Column Mappings:\n")
+                    parts.append("   Column Mappings:\n")
                     for col_name, cell_mapping in config.column_mappings.items():
                         if cell_mapping.apply_to_all_sheets:
                             apply_info = " (All Sheets)"
@@ -2257,10 +2822,13 @@ class MultiTableExporterApp:
                                 apply_info = f" (Sheets: {', '.join(sheets[:3])} +{len(sheets)-3} more)"
                         else:
                             apply_info = f" (Sheet: {cell_mapping.template_sheet})"
-                        
-                        self.mapping_text.insert(tk.END, f"     • {col_name} → {cell_mapping.template_cell}{apply_info}\n")
-            
-            self.mapping_text.insert(tk.END, "\n")
+
+                        parts.append(f"     • {col_name} → {cell_mapping.template_cell}{apply_info}\n")
+
+            parts.append("\n")
+
+        self.mapping_text.delete(1.0, tk.END)
+        self.mapping_text.insert(1.0, "".join(parts))
     
     def fetch_filtered_table_data(self, limit: int = 0) -> Dict:
         """Fetch data for all selected tables with filters applied - VALUES ONLY, NO COLUMN NAMES"""
@@ -2270,53 +2838,93 @@ class MultiTableExporterApp:
             self.log("[ERROR] Database not connected", 'error')
             return tables_data
         
-        self.log(f"[FETCH] Fetching filtered data for {len(self.selected_tables)} tables (VALUES ONLY)...", 'info')
-        
-        for table in self.selected_tables:
-            try:
-                self.log(f"Fetching {table} with filters (VALUES ONLY)...", 'info')
-                
-                # Get filters for this table
+        tables = list(self.selected_tables)
+        self.log(f"[FETCH] Fetching filtered data for {len(tables)} tables (VALUES ONLY)...", 'info')
+
+        def fetch_one(table, connection=None):
+            # Fetch data with filters - THIS RETURNS PURE VALUES ONLY, NO COLUMN NAMES
+            filters = self.filters.get(table, {})
+            return self.db.fetch_filtered_data(
+                table_name=table,
+                batch_name=filters.get('batch'),
+                start_time=filters.get('start_time'),
+                end_time=filters.get('end_time'),
+                limit=limit if limit > 0 else None,
+                connection=connection
+            )
+
+        def record_result(table, data):
+            tables_data[table] = data
+
+            if data['success']:
                 filters = self.filters.get(table, {})
                 batch_name = filters.get('batch')
                 start_time = filters.get('start_time')
                 end_time = filters.get('end_time')
-                
-                # Fetch data with filters - THIS RETURNS PURE VALUES ONLY, NO COLUMN NAMES
-                data = self.db.fetch_filtered_data(
-                    table_name=table,
-                    batch_name=batch_name,
-                    start_time=start_time,
-                    end_time=end_time,
-                    limit=limit if limit > 0 else None
-                )
-                
-                tables_data[table] = data
-                
-                if data['success']:
-                    filter_info = ""
-                    if batch_name:
-                        filter_info += f"Batch: {batch_name} "
-                    if start_time or end_time:
-                        filter_info += f"Time range: {start_time if start_time else 'Start'} to {end_time if end_time else 'End'}"
-                    
-                    self.log(f"[OK] {data['display_name']}: {data['row_count']} rows (VALUES ONLY) {filter_info}", 'success')
-                    
-                    # Show sample data in log - PURE VALUES ONLY
-                    if data['data'] and len(data['data']) > 0:
-                        sample_row = data['data'][0]
-                        sample_str = ", ".join([str(v) for v in sample_row[:3]])
-                        if len(sample_row) > 3:
-                            sample_str += "..."
-                        self.log(f"   Sample values: {sample_str}", 'info')
-                else:
-                    self.log(f"[ERROR] {data['display_name']}: {data.get('error', 'Unknown error')}", 'error')
-                    
-            except Exception as e:
-                tables_data[table] = {'success': False, 'error': str(e)}
-                self.log(f"[ERROR] {table}: {str(e)}", 'error')
-                logger.error(f"Error fetching {table}: {str(e)}")
-        
+
+                filter_info = ""
+                if batch_name:
+                    filter_info += f"Batch: {batch_name} "
+                if start_time or end_time:
+                    filter_info += f"Time range: {start_time if start_time else 'Start'} to {end_time if end_time else 'End'}"
+
+                self.log(f"[OK] {data['display_name']}: {data['row_count']} rows (VALUES ONLY) {filter_info}", 'success')
+
+                # Show sample data in log - PURE VALUES ONLY
+                if data['data'] and len(data['data']) > 0:
+                    sample_row = data['data'][0]
+                    sample_str = ", ".join([str(v) for v in sample_row[:3]])
+                    if len(sample_row) > 3:
+                        sample_str += "..."
+                    self.log(f"   Sample values: {sample_str}", 'info')
+            else:
+                self.log(f"[ERROR] {data['display_name']}: {data.get('error', 'Unknown error')}", 'error')
+
+        if len(tables) > 1:
+            # The per-table fetches are independent network round trips,
+            # so run them in a small pool. Each worker thread opens its
+            # own connection (pyodbc releases the GIL around driver
+            # calls, but one connection cannot serve concurrent cursors).
+            thread_state = threading.local()
+            worker_connections = []
+
+            def fetch_with_own_connection(table):
+                connection = getattr(thread_state, 'connection', None)
+                if connection is None:
+                    connection = self.db.open_connection()
+                    thread_state.connection = connection
+                    worker_connections.append(connection)
+                return fetch_one(table, connection=connection)
+
+            try:
+                with concurrent.futures.ThreadPoolExecutor(
+                        max_workers=min(8, len(tables))) as executor:
+                    futures = {executor.submit(fetch_with_own_connection, t): t
+                               for t in tables}
+                    for future in concurrent.futures.as_completed(futures):
+                        table = futures[future]
+                        try:
+                            record_result(table, future.result())
+                        except Exception as e:
+                            tables_data[table] = {'success': False, 'error': str(e)}
+                            self.log(f"[ERROR] {table}: {str(e)}", 'error')
+                            logger.error(f"Error fetching {table}: {str(e)}")
+            finally:
+                for connection in worker_connections:
+                    try:
+                        connection.close()
+                    except Exception:
+                        pass
+        else:
+            for table in tables:
+                try:
+                    self.log(f"Fetching {table} with filters (VALUES ONLY)...", 'info')
+                    record_result(table, fetch_one(table))
+                except Exception as e:
+                    tables_data[table] = {'success': False, 'error': str(e)}
+                    self.log(f"[ERROR] {table}: {str(e)}", 'error')
+                    logger.error(f"Error fetching {table}: {str(e)}")
+
         return tables_data
     
     def export_new_excel(self):
@@ -2382,12 +2990,8 @@ class MultiTableExporterApp:
                 return
         
         # Get merge rules
-        try:
-            merge_text = self.merge_rules_text.get("1.0", tk.END).strip()
-            merge_rules = [line.strip() for line in merge_text.splitlines() if line.strip()]
-            self.log(f"Using {len(merge_rules)} merge rules", 'info')
-        except:
-            merge_rules = []
+        merge_rules = self._parse_merge_rules()
+        self.log(f"Using {len(merge_rules)} merge rules", 'info')
         
         # Ask for save location
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -2515,11 +3119,42 @@ class MultiTableExporterApp:
         ttk.Button(btn_frame, text="OK", 
                   command=dialog.destroy, width=8).pack(side=tk.RIGHT, padx=5)
     
+    # Upper bound on log lines appended per drain tick, so a logging
+    # burst cannot monopolize the Tk thread
+    LOG_DRAIN_LIMIT = 200
+
     def log(self, message: str, tag: str = 'info'):
-        """Add message to log"""
+        """Queue a log line; the Tk thread appends it on the next drain.
+
+        Safe to call from worker threads - only _drain_log_queue ever
+        touches the Text widget.
+        """
         timestamp = datetime.now().strftime('%H:%M:%S')
-        self.log_text.insert(tk.END, f"[{timestamp}] {message}\n", tag)
-        self.log_text.see(tk.END)
+        self.log_queue.put((f"[{timestamp}] {message}\n", tag))
+
+    def _drain_log_queue(self):
+        """Flush queued log lines into the Text widget in batches"""
+        appended = False
+        run_text = []
+        run_tag = None
+        try:
+            for _ in range(self.LOG_DRAIN_LIMIT):
+                text, tag = self.log_queue.get_nowait()
+                if run_text and tag != run_tag:
+                    self.log_text.insert(tk.END, "".join(run_text), run_tag)
+                    run_text.clear()
+                run_tag = tag
+                run_text.append(text)
+                appended = True
+        except queue.Empty:
+            pass
+
+        if run_text:
+            self.log_text.insert(tk.END, "".join(run_text), run_tag)
+        if appended:
+            self.log_text.see(tk.END)
+
+        self.root.after(100, self._drain_log_queue)
     
     def on_closing(self):
         """Handle window closing"""
@@ -2551,4 +3186,8 @@ def main():
     root.mainloop()
 
 if __name__ == "__main__":
+    # Required for the ProcessPoolExecutor export path in a frozen exe:
+    # without it the spawned worker re-runs the GUI instead of
+    # bootstrapping as a worker process
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
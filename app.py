@@ -6,19 +6,21 @@ With advanced filtering and multi-sheet support
 """
 
 import streamlit as st
-import pandas as pd
+import concurrent.futures
 import os
 import sys
 import logging
 from datetime import datetime, timedelta
 from openpyxl import load_workbook, Workbook
-from openpyxl.styles import Alignment
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Font
 from openpyxl.utils import get_column_letter, column_index_from_string
 import traceback
 import shutil
 import re
 import tempfile
 import base64
+import csv
 from io import BytesIO
 from typing import Dict, List, Optional, Any, Tuple
 import json
@@ -97,7 +99,10 @@ class DatabaseManager:
         self.driver = None
         self.table_cache = {}
         self.column_cache = {}
-    
+        self.batch_cache = {}
+        # Pure name transform - never invalidated, unlike the caches above
+        self.display_name_cache = {}
+
     def connect(self, server: str, database: str) -> Tuple[bool, str]:
         """Connect to SQL Server with optimized pyodbc connection"""
         if not SQLALCHEMY_AVAILABLE:
@@ -109,6 +114,7 @@ class DatabaseManager:
             # Clear caches
             self.table_cache.clear()
             self.column_cache.clear()
+            self.batch_cache.clear()
             
             # Try different connection methods in order
             connection_methods = []
@@ -200,6 +206,7 @@ class DatabaseManager:
                 self.engine.dispose()
             self.table_cache.clear()
             self.column_cache.clear()
+            self.batch_cache.clear()
             logger.info("Disconnected")
         except Exception as e:
             logger.error(f"Error disconnecting: {e}")
@@ -265,7 +272,12 @@ class DatabaseManager:
             return []
     
     def get_batches_from_table(self, table_name: str) -> List[str]:
-        """Get distinct batch names from a table"""
+        """Get distinct batch names from a table (cached per connection)"""
+        # Streamlit reruns the filters page on every widget interaction,
+        # so without a cache this DISTINCT query fires per click
+        if table_name in self.batch_cache:
+            return self.batch_cache[table_name]
+
         try:
             columns = self.get_table_columns(table_name)
             batch_column = None
@@ -279,14 +291,16 @@ class DatabaseManager:
                     break
             
             if not batch_column:
+                self.batch_cache[table_name] = []
                 return []
-            
+
             query = f"SELECT DISTINCT [{batch_column}] FROM [{table_name}] WHERE [{batch_column}] IS NOT NULL ORDER BY [{batch_column}]"
-            
+
             with self.engine.connect() as conn:
                 result = conn.execute(text(query))
                 batches = [str(row[0]) for row in result.fetchall()]
-            
+
+            self.batch_cache[table_name] = batches
             return batches
             
         except Exception as e:
@@ -344,30 +358,50 @@ class DatabaseManager:
             if where_clauses:
                 query += " WHERE " + " AND ".join(where_clauses)
             
-            # Execute query
-            with self.engine.connect() as conn:
-                df = pd.read_sql_query(text(query), conn, params=params)
-            
-            # Convert to list of lists
+            # Execute query - iterate the result in chunks instead of
+            # materializing a DataFrame first and then converting it
+            # row by row; that held two full copies of the result at once
             data = []
-            for _, row in df.iterrows():
-                row_list = []
-                for value in row:
-                    if pd.isna(value):
-                        row_list.append("")
-                    elif isinstance(value, datetime):
-                        row_list.append(value.strftime('%Y-%m-%d %H:%M:%S'))
-                    elif isinstance(value, timedelta):
-                        total_seconds = int(value.total_seconds())
-                        hours, remainder = divmod(total_seconds, 3600)
-                        minutes, seconds = divmod(remainder, 60)
-                        row_list.append(f"{hours:02d}:{minutes:02d}:{seconds:02d}")
-                    elif isinstance(value, (int, float)):
-                        row_list.append(value)
-                    else:
-                        row_list.append(str(value).strip() if value else "")
-                data.append(row_list)
-            
+            append = data.append
+            with self.engine.connect() as conn:
+                # Server-side cursor: stream rows through a bounded
+                # buffer instead of letting the driver pull the whole
+                # result set into memory before the first fetchmany()
+                result = conn.execution_options(
+                    stream_results=True, max_row_buffer=10000
+                ).execute(text(query), params)
+                while True:
+                    rows = result.fetchmany(10000)
+                    if not rows:
+                        break
+                    for row in rows:
+                        row_list = []
+                        rl_append = row_list.append
+                        for value in row:
+                            # Exact-type checks first, ordered by how
+                            # common each type is in a result set; the
+                            # isinstance fallbacks keep subclasses (bool,
+                            # driver-specific numerics) behaving as before
+                            vt = type(value)
+                            if vt is str:
+                                rl_append(value.strip() if value else "")
+                            elif vt is int or vt is float:
+                                rl_append(value)
+                            elif value is None:
+                                rl_append("")
+                            elif vt is datetime or isinstance(value, datetime):
+                                rl_append(value.strftime('%Y-%m-%d %H:%M:%S'))
+                            elif isinstance(value, timedelta):
+                                total_seconds = int(value.total_seconds())
+                                hours, remainder = divmod(total_seconds, 3600)
+                                minutes, seconds = divmod(remainder, 60)
+                                rl_append(f"{hours:02d}:{minutes:02d}:{seconds:02d}")
+                            elif isinstance(value, (int, float)):
+                                rl_append(value)
+                            else:
+                                rl_append(str(value).strip() if value else "")
+                        append(row_list)
+
             row_count = len(data)
             logger.info(f"Fetched {row_count} rows from {table_name}")
             
@@ -417,14 +451,20 @@ class DatabaseManager:
     
     def get_display_name(self, table_name: str) -> str:
         """Convert table name to display name"""
+        cached = self.display_name_cache.get(table_name)
+        if cached is not None:
+            return cached
+
         name = table_name.replace('_', ' ').title()
-        
+
         prefixes = ['Tbl', 'Table', 'Vw', 'View', 'Dim', 'Fact']
         for prefix in prefixes:
             if name.startswith(prefix + ' '):
                 name = name[len(prefix):].strip()
-        
-        return name if name else table_name
+
+        name = name if name else table_name
+        self.display_name_cache[table_name] = name
+        return name
 
 # ============================================================================
 # EXCEL EXPORTER
@@ -432,35 +472,108 @@ class DatabaseManager:
 
 class ExcelTableExporter:
     """Handles exporting tables to Excel"""
-    
+
+    # Rows sampled when sizing columns; scanning a full large table
+    # costs more than the widths are worth
+    WIDTH_SAMPLE_ROWS = 1000
+
+    @staticmethod
+    def _column_widths(table_data: Dict) -> List[int]:
+        """Column widths from the headers plus a row sample, one pass"""
+        columns = table_data.get('column_names', [])
+        rows = table_data['data']
+
+        n_cols = max(len(columns), max((len(r) for r in rows[:1]), default=0))
+        widths = [0] * n_cols
+        for i, col in enumerate(columns[:n_cols]):
+            widths[i] = len(col)
+
+        for row_data in rows[:ExcelTableExporter.WIDTH_SAMPLE_ROWS]:
+            for i, value in enumerate(row_data):
+                if value is not None and i < n_cols:
+                    length = len(str(value))
+                    if length > widths[i]:
+                        widths[i] = length
+
+        return [min(w + 2, 50) for w in widths]
+
     @staticmethod
     def export_tables_to_new_excel(tables_data: Dict, output_path: str) -> bool:
         """Export to new Excel file"""
         try:
-            wb = Workbook()
-            
-            # Remove default sheet
-            if wb.sheetnames:
-                wb.remove(wb.active)
-            
+            # Write-only mode streams rows to disk instead of keeping a
+            # Cell object per value in memory
+            wb = Workbook(write_only=True)
+            header_font = Font(bold=True)
+
             for table_name, table_data in tables_data.items():
                 if table_data.get('success', False):
                     sheet_name = ExcelTableExporter.get_valid_sheet_name(table_data['display_name'])
                     ws = wb.create_sheet(title=sheet_name)
-                    
-                    data = table_data['data']
-                    for row_idx, row_data in enumerate(data, 1):
-                        for col_idx, value in enumerate(row_data, 1):
-                            ws.cell(row=row_idx, column=col_idx, value=value)
+
+                    # Column widths must be declared before the first
+                    # append in write-only mode
+                    for i, width in enumerate(ExcelTableExporter._column_widths(table_data), start=1):
+                        ws.column_dimensions[get_column_letter(i)].width = width
+
+                    # Header row with the shared bold font
+                    column_names = table_data.get('column_names', [])
+                    if column_names:
+                        header = []
+                        for col_name in column_names:
+                            cell = WriteOnlyCell(ws, value=col_name)
+                            cell.font = header_font
+                            header.append(cell)
+                        ws.append(header)
+
+                    # One append per row - the per-cell ws.cell() path pays
+                    # coordinate bookkeeping for every single value
+                    for row_data in table_data['data']:
+                        ws.append(row_data)
             
-            wb.save(output_path)
+            # Hand openpyxl a wide-buffered handle so the zip stream hits
+            # the disk in 1MB writes instead of many small ones
+            with open(output_path, 'wb', buffering=1 << 20) as fh:
+                wb.save(fh)
             logger.info(f"Created Excel: {output_path}")
             return True
             
         except Exception as e:
             logger.error(f"Error creating Excel: {e}")
             return False
-    
+
+    @staticmethod
+    def export_tables_to_csv(tables_data: Dict, output_path: str) -> bool:
+        """Export to a CSV file - csv.writer skips all of the XML and zip
+        work an xlsx needs, so this path is much faster for large pulls
+        that only feed downstream scripts anyway"""
+        try:
+            with open(output_path, 'w', newline='', buffering=1 << 20,
+                      encoding='utf-8-sig') as f:
+                writer = csv.writer(f)
+                first = True
+                multiple = sum(1 for t in tables_data.values()
+                               if t.get('success', False)) > 1
+                for table_name, table_data in tables_data.items():
+                    if not table_data.get('success', False):
+                        continue
+                    if not first:
+                        writer.writerow([])
+                    # With several tables in one file, label each section
+                    # so the table boundaries survive the flat format
+                    if multiple:
+                        writer.writerow([table_data['display_name']])
+                    writer.writerow(table_data.get('column_names', []))
+                    writer.writerows(table_data['data'])
+                    first = False
+
+            logger.info(f"Created CSV: {output_path}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error creating CSV: {e}")
+            return False
+
     @staticmethod
     def export_tables_to_template(tables_data: Dict, template_path: str, 
                                 table_configs: Dict[str, TableConfig],
@@ -550,8 +663,9 @@ class ExcelTableExporter:
                                 cell_ref = f"{get_column_letter(cell_col)}{cell_row}"
                                 ExcelTableExporter.write_to_cell_safe(wb, sheet_name, cell_ref, value)
             
-            # Save workbook
-            wb.save(output_path)
+            # Save workbook through a wide-buffered handle
+            with open(output_path, 'wb', buffering=1 << 20) as fh:
+                wb.save(fh)
             logger.info("Template export completed")
             return True
             
@@ -1124,7 +1238,12 @@ def show_export_tab():
         
         # Export button
         if st.button("🚀 Export to Excel", type="primary", use_container_width=True):
-            if not output_filename.endswith('.xlsx'):
+            # A .csv filename picks the plain-text fast path; templates
+            # are xlsx by nature, so the CSV path only applies to the
+            # New Excel File mode
+            use_csv = (output_filename.endswith('.csv')
+                       and export_mode != "Use Template")
+            if not use_csv and not output_filename.endswith('.xlsx'):
                 output_filename += '.xlsx'
             
             temp_dir = tempfile.gettempdir()
@@ -1141,24 +1260,49 @@ def show_export_tab():
                 all_data = {}
                 row_limit = st.session_state.row_limit if st.session_state.row_limit > 0 else None
                 
-                # Fetch data for each table
-                for i, table_name in enumerate(st.session_state.selected_tables):
-                    filters = st.session_state.filters.get(table_name, {})
-                    
-                    result = st.session_state.db.fetch_filtered_data(
+                # Fetch tables concurrently - the engine's connection
+                # pool hands each worker its own connection, so the per-
+                # table network waits overlap instead of adding up.
+                # Each progress() call is a message to the browser, so
+                # only send it when the percentage actually changes.
+                # Read session state on the main thread only - worker
+                # threads have no script-run context, so st.session_state
+                # resolves to an empty fallback there
+                db = st.session_state.db
+                filters_map = st.session_state.filters
+
+                def fetch_one(table_name):
+                    filters = filters_map.get(table_name, {})
+                    return db.fetch_filtered_data(
                         table_name=table_name,
                         batch_name=filters.get('batch'),
                         start_time=filters.get('start_time'),
                         end_time=filters.get('end_time'),
                         limit=row_limit
                     )
-                    
-                    all_data[table_name] = result
-                    progress_bar.progress(30 + int(40 * (i + 1) / len(st.session_state.selected_tables)))
+
+                tables = st.session_state.selected_tables
+                table_count = len(tables)
+                last_pct = 30
+
+                if table_count > 1:
+                    with concurrent.futures.ThreadPoolExecutor(
+                            max_workers=min(4, table_count)) as pool:
+                        futures = {pool.submit(fetch_one, t): t for t in tables}
+                        for i, future in enumerate(
+                                concurrent.futures.as_completed(futures)):
+                            all_data[futures[future]] = future.result()
+                            pct = 30 + int(40 * (i + 1) / table_count)
+                            if pct != last_pct:
+                                progress_bar.progress(pct)
+                                last_pct = pct
+                else:
+                    all_data[tables[0]] = fetch_one(tables[0])
+                    progress_bar.progress(70)
                 
-                status_text.info("Exporting to Excel...")
+                status_text.info("Exporting to CSV..." if use_csv else "Exporting to Excel...")
                 progress_bar.progress(80)
-                
+
                 # Export data
                 success = False
                 if export_mode == "Use Template" and st.session_state.template_path:
@@ -1169,6 +1313,11 @@ def show_export_tab():
                         output_path=output_path,
                         merge_rules=st.session_state.merge_rules
                     )
+                elif use_csv:
+                    success = ExcelTableExporter.export_tables_to_csv(
+                        tables_data=all_data,
+                        output_path=output_path
+                    )
                 else:
                     success = ExcelTableExporter.export_tables_to_new_excel(
                         tables_data=all_data,
@@ -1186,8 +1335,10 @@ def show_export_tab():
                             excel_data = f.read()
                         
                         b64 = base64.b64encode(excel_data).decode()
+                        mime = ('text/csv' if use_csv else
+                                'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
                         download_link = f'''
-                        <a href="data:application/vnd.openxmlformats-officedocument.spreadsheetml.sheet;base64,{b64}" 
+                        <a href="data:{mime};base64,{b64}"
                            download="{output_filename}" 
                            style="background-color:#4CAF50;color:white;padding:10px 20px;text-decoration:none;border-radius:5px;display:inline-block;">
                            📥 Download {output_filename}
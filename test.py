@@ -13,17 +13,34 @@ if not HAS_TK:
 import pyodbc
 import json
 import os
+import queue
+import subprocess
+import time
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import xlsxwriter
+    HAS_XLSXWRITER = True
+except ImportError:
+    HAS_XLSXWRITER = False
 import logging
 from datetime import datetime
 import threading
 import sys
 from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import PatternFill, Font, Alignment, Border, Side
 from openpyxl.utils import get_column_letter, column_index_from_string
 import traceback
 import shutil
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
+from collections import deque
 import re
 
 # Setup logging
@@ -44,28 +61,86 @@ logger = logging.getLogger(__name__)
 class DatabaseManager:
     """Manages database connections and queries"""
     
+    # Rows per fetchmany batch (and per ODBC rowset round-trip)
+    FETCH_BATCH_ROWS = 8192
+
+    # Preferred drivers, newest first; the legacy driver is the last resort
+    PREFERRED_DRIVERS = [
+        'ODBC Driver 18 for SQL Server',
+        'ODBC Driver 17 for SQL Server',
+        'ODBC Driver 13 for SQL Server',
+        'SQL Server'
+    ]
+
     def __init__(self):
         self.connection = None
         self.connected = False
         self.server = None
         self.database = None
-    
-    def connect(self, server: str, database: str, 
+        self._column_sql_cache = {}  # table_name -> quoted column list
+        self._tables_cache = None    # table list for the current database
+        self._columns_cache = {}     # table_name -> column names
+        self._display_name_cache = {}  # table_name -> display label
+
+    @staticmethod
+    def _select_driver() -> str:
+        """Pick the newest installed SQL Server ODBC driver"""
+        try:
+            installed = set(pyodbc.drivers())
+            for driver in DatabaseManager.PREFERRED_DRIVERS:
+                if driver in installed:
+                    return driver
+        except Exception as e:
+            logger.warning(f"Could not enumerate ODBC drivers: {e}")
+        return 'SQL Server'
+
+    def connect(self, server: str, database: str,
                 username: str = None, password: str = None,
                 use_windows_auth: bool = True) -> Tuple[bool, str]:
         """Connect to SQL Server database"""
         try:
             # Build connection string
+            driver = self._select_driver()
+            conn_str = f"DRIVER={{{driver}}};SERVER={server};DATABASE={database};"
             if use_windows_auth:
-                conn_str = f"DRIVER={{SQL Server}};SERVER={server};DATABASE={database};Trusted_Connection=yes;"
+                conn_str += "Trusted_Connection=yes;"
             else:
-                conn_str = f"DRIVER={{SQL Server}};SERVER={server};DATABASE={database};UID={username};PWD={password};"
-            
-            # Attempt connection
-            self.connection = pyodbc.connect(conn_str)
+                conn_str += f"UID={username};PWD={password};"
+            if driver != 'SQL Server':
+                # Modern drivers default to encryption; trust the local server cert
+                conn_str += "Encrypt=yes;TrustServerCertificate=yes;"
+
+            # Attempt connection. The app only reads, so autocommit avoids
+            # the implicit transaction SQL Server tracks per SELECT.
+            # The TDS packet size must be negotiated during the handshake,
+            # hence attrs_before; 32KB packets instead of the 4KB default
+            # cut round-trips substantially on slower links.  pyodbc does
+            # not export this constant, so use the ODBC value directly
+            # (SQL_ATTR_PACKET_SIZE = 112, sqlext.h).
+            SQL_ATTR_PACKET_SIZE = 112
+            self.connection = pyodbc.connect(
+                conn_str, autocommit=True,
+                attrs_before={SQL_ATTR_PACKET_SIZE: 32768})
+            # utf-16le matches the TDS wire format for NVARCHAR, so
+            # pyodbc decodes without a transcoding pass.  SQL_CHAR is
+            # deliberately left at the driver default - plain VARCHAR
+            # arrives in the database collation's codepage, not UTF-8.
+            self.connection.setdecoding(pyodbc.SQL_WCHAR, encoding='utf-16le')
+            self.connection.setencoding(encoding='utf-16le')
+
+            # DECIMAL/NUMERIC columns come back as Decimal objects.  An
+            # output converter to float looked attractive, but pyodbc
+            # fetches converter columns as SQL_C_BINARY, so the payload
+            # is driver-defined - the MS driver returns locale-formatted
+            # text (decimal comma on many servers) that float() rejects.
+            # Decimal stays until that path is verified per driver.
+
             self.connected = True
             self.server = server
             self.database = database
+            self._column_sql_cache.clear()
+            self._tables_cache = None
+            self._columns_cache.clear()
             
             logger.info(f"Connected to {server}.{database}")
             return True, "Connection successful"
@@ -94,9 +169,15 @@ class DatabaseManager:
             self.connected = False
             self.server = None
             self.database = None
+            self._column_sql_cache.clear()
+            self._tables_cache = None
+            self._columns_cache.clear()
     
-    def get_tables(self) -> List[str]:
-        """Get list of tables in the database"""
+    def get_tables(self, refresh: bool = False) -> List[str]:
+        """Get list of tables in the database (cached per connection)"""
+        if self._tables_cache is not None and not refresh:
+            return self._tables_cache
+
         try:
             cursor = self.connection.cursor()
             
@@ -111,7 +192,8 @@ class DatabaseManager:
             cursor.execute(query)
             tables = [row[0] for row in cursor.fetchall()]
             cursor.close()
-            
+
+            self._tables_cache = tables
             logger.info(f"Retrieved {len(tables)} tables")
             return tables
             
@@ -120,7 +202,11 @@ class DatabaseManager:
             raise
     
     def get_table_columns(self, table_name: str) -> List[str]:
-        """Get column names for a specific table"""
+        """Get column names for a specific table (cached per connection)"""
+        cached = self._columns_cache.get(table_name)
+        if cached is not None:
+            return cached
+
         try:
             cursor = self.connection.cursor()
             
@@ -135,22 +221,58 @@ class DatabaseManager:
             cursor.execute(query, (table_name,))
             columns = [row[0] for row in cursor.fetchall()]
             cursor.close()
-            
+
+            self._columns_cache[table_name] = columns
             logger.info(f"Retrieved {len(columns)} columns for table {table_name}")
             return columns
             
         except Exception as e:
             logger.error(f"Error getting columns for {table_name}: {e}")
             raise
-    
-    def fetch_table_data(self, table_name: str, limit: int = None) -> Dict:
+
+    def get_all_columns(self, tables: List[str]) -> Dict[str, List[str]]:
+        """Get column names for several tables in a single round-trip"""
+        if not tables:
+            return {}
+
+        try:
+            cursor = self.connection.cursor()
+
+            placeholders = ', '.join('?' for _ in tables)
+            query = f"""
+            SELECT TABLE_NAME, COLUMN_NAME
+            FROM INFORMATION_SCHEMA.COLUMNS
+            WHERE TABLE_NAME IN ({placeholders})
+            ORDER BY TABLE_NAME, ORDINAL_POSITION
+            """
+
+            cursor.execute(query, tuple(tables))
+            columns_by_table = {table: [] for table in tables}
+            for table_name, column_name in cursor.fetchall():
+                columns_by_table.setdefault(table_name, []).append(column_name)
+            cursor.close()
+
+            # Feed the per-table cache so later single-table lookups
+            # become dict hits instead of round-trips
+            self._columns_cache.update(columns_by_table)
+
+            logger.info(f"Retrieved columns for {len(tables)} tables in one query")
+            return columns_by_table
+
+        except Exception as e:
+            logger.error(f"Error getting columns for {len(tables)} tables: {e}")
+            raise
+
+    def fetch_table_data(self, table_name: str, limit: int = None,
+                         columns: List[str] = None) -> Dict:
         """Fetch data from a specific table"""
         try:
             # Get display name
             display_name = self.get_display_name(table_name)
-            
-            # Get columns
-            columns = self.get_table_columns(table_name)
+
+            # Get columns (callers may pass a prefetched list)
+            if columns is None:
+                columns = self.get_table_columns(table_name)
             
             if not columns:
                 return {
@@ -160,8 +282,11 @@ class DatabaseManager:
                     'table_name': table_name
                 }
             
-            # Build query
-            column_list = ', '.join([f'[{col}]' for col in columns])
+            # Build query (quoted column list is cached per table)
+            column_list = self._column_sql_cache.get(table_name)
+            if column_list is None:
+                column_list = ', '.join(f'[{col}]' for col in columns)
+                self._column_sql_cache[table_name] = column_list
             query = f"SELECT {column_list} FROM [{table_name}]"
             
             if limit and limit > 0:
@@ -169,20 +294,48 @@ class DatabaseManager:
             
             # Execute query
             cursor = self.connection.cursor()
+            cursor.arraysize = self.FETCH_BATCH_ROWS  # rows per TDS round-trip
             cursor.execute(query)
-            
-            # Fetch all rows
-            rows = cursor.fetchall()
-            row_count = len(rows)
-            
-            # Convert to list of dictionaries
+
+            # Producer-consumer fetch: a reader thread pulls the next
+            # rowset off the wire while this thread converts the previous
+            # one, overlapping network wait with Python row construction.
+            # The bounded queue keeps at most a few batches in flight.
+            batches = queue.Queue(maxsize=4)
+            read_error = []
+
+            def read_batches():
+                try:
+                    while True:
+                        batch = cursor.fetchmany(self.FETCH_BATCH_ROWS)
+                        if not batch:
+                            break
+                        batches.put(batch)
+                except Exception as e:
+                    read_error.append(e)
+                finally:
+                    batches.put(None)  # end-of-stream marker
+
+            reader = threading.Thread(target=read_batches, daemon=True)
+            reader.start()
+
+            # Rows are stored as plain tuples in column order rather than
+            # dicts: one small object per row instead of a hash table,
+            # and consumers index by position via the columns list
             data = []
-            for row in rows:
-                row_dict = {}
-                for i, col in enumerate(columns):
-                    row_dict[col] = row[i]
-                data.append(row_dict)
-            
+            append = data.append
+            while True:
+                batch = batches.get()
+                if batch is None:
+                    break
+                for row in batch:
+                    append(tuple(row))
+
+            reader.join()
+            if read_error:
+                raise read_error[0]
+            row_count = len(data)
+
             cursor.close()
             
             logger.info(f"Fetched {row_count} rows from {table_name}")
@@ -210,7 +363,11 @@ class DatabaseManager:
             }
     
     def get_display_name(self, table_name: str) -> str:
-        """Convert table name to display name"""
+        """Convert table name to display name (memoized per table)"""
+        cached = self._display_name_cache.get(table_name)
+        if cached is not None:
+            return cached
+
         # Remove underscores and capitalize
         display_name = table_name.replace('_', ' ').title()
         
@@ -226,8 +383,10 @@ class DatabaseManager:
         for old, new in replacements.items():
             if display_name.startswith(old):
                 display_name = display_name.replace(old, new, 1).strip()
-        
-        return display_name if display_name else table_name
+
+        display_name = display_name if display_name else table_name
+        self._display_name_cache[table_name] = display_name
+        return display_name
 
 # ============================================================================
 # DATA CLASSES
@@ -261,15 +420,25 @@ class TableConfig:
 
 class SheetSelectionDialog:
     """Dialog for selecting specific sheets"""
-    
+
+    # Above this many sheets, one Listbox replaces per-sheet Checkbuttons
+    LISTBOX_THRESHOLD = 50
+
     def __init__(self, parent, available_sheets: List[str], title: str = "Select Sheets"):
         self.parent = parent
         self.available_sheets = available_sheets
         self.title = title
         self.selected_sheets = []
         self.result = None
-        
-        self.create_dialog()
+        self.dialog = None
+        self.sheet_vars = {}
+        self.sheet_listbox = None
+
+        if len(self.available_sheets) <= 1:
+            # Nothing to choose - skip building any widgets
+            self.result = list(self.available_sheets)
+        else:
+            self.create_dialog()
     
     def create_dialog(self):
         """Create the sheet selection dialog"""
@@ -306,44 +475,57 @@ class SheetSelectionDialog:
         ttk.Label(instr_frame, text="• Leave unchecked to skip", 
                  font=('Arial', 9)).pack(anchor='w', pady=1)
         
-        # Create scrollable frame for sheet checkboxes
-        canvas = tk.Canvas(main_frame, highlightthickness=0)
-        scrollbar = ttk.Scrollbar(main_frame, orient="vertical", command=canvas.yview)
-        sheet_frame = ttk.Frame(canvas)
-        
-        canvas.pack(side=tk.LEFT, fill='both', expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill='y')
-        
-        canvas.configure(yscrollcommand=scrollbar.set)
-        canvas.create_window((0, 0), window=sheet_frame, anchor="nw")
-        
-        # Store variables
-        self.sheet_vars = {}
-        
-        # Create checkboxes for each sheet
-        for sheet in self.available_sheets:
-            var = tk.BooleanVar(value=True)  # Default selected
-            self.sheet_vars[sheet] = var
-            
-            cb_frame = ttk.Frame(sheet_frame)
-            cb_frame.pack(fill='x', padx=5, pady=2)
-            
-            cb = ttk.Checkbutton(cb_frame, text=sheet, variable=var)
-            cb.pack(anchor='w')
-        
-        # Configure scrolling
-        def on_frame_configure(event):
-            canvas.configure(scrollregion=canvas.bbox("all"))
-        
-        sheet_frame.bind("<Configure>", on_frame_configure)
-        
+        if len(self.available_sheets) > self.LISTBOX_THRESHOLD:
+            # Many sheets: a single multi-select Listbox instead of N Checkbuttons
+            list_frame = ttk.Frame(main_frame)
+            list_frame.pack(fill='both', expand=True)
+
+            self.sheet_listbox = tk.Listbox(list_frame, selectmode='extended')
+            scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=self.sheet_listbox.yview)
+            self.sheet_listbox.configure(yscrollcommand=scrollbar.set)
+
+            self.sheet_listbox.pack(side=tk.LEFT, fill='both', expand=True)
+            scrollbar.pack(side=tk.RIGHT, fill='y')
+
+            for sheet in self.available_sheets:
+                self.sheet_listbox.insert(tk.END, sheet)
+            self.sheet_listbox.selection_set(0, tk.END)  # Default selected
+        else:
+            # Create scrollable frame for sheet checkboxes
+            canvas = tk.Canvas(main_frame, highlightthickness=0)
+            scrollbar = ttk.Scrollbar(main_frame, orient="vertical", command=canvas.yview)
+            sheet_frame = ttk.Frame(canvas)
+
+            canvas.pack(side=tk.LEFT, fill='both', expand=True)
+            scrollbar.pack(side=tk.RIGHT, fill='y')
+
+            canvas.configure(yscrollcommand=scrollbar.set)
+            canvas.create_window((0, 0), window=sheet_frame, anchor="nw")
+
+            # Create checkboxes for each sheet
+            for sheet in self.available_sheets:
+                var = tk.BooleanVar(value=True)  # Default selected
+                self.sheet_vars[sheet] = var
+
+                cb_frame = ttk.Frame(sheet_frame)
+                cb_frame.pack(fill='x', padx=5, pady=2)
+
+                cb = ttk.Checkbutton(cb_frame, text=sheet, variable=var)
+                cb.pack(anchor='w')
+
+            # Configure scrolling
+            def on_frame_configure(event):
+                canvas.configure(scrollregion=canvas.bbox("all"))
+
+            sheet_frame.bind("<Configure>", on_frame_configure)
+
         # Control buttons
-        control_frame = ttk.Frame(sheet_frame)
+        control_frame = ttk.Frame(main_frame)
         control_frame.pack(fill='x', pady=10)
-        
-        ttk.Button(control_frame, text="Select All", 
+
+        ttk.Button(control_frame, text="Select All",
                   command=self.select_all).pack(side=tk.LEFT, padx=5)
-        ttk.Button(control_frame, text="Clear All", 
+        ttk.Button(control_frame, text="Clear All",
                   command=self.clear_all).pack(side=tk.LEFT, padx=5)
         
         # Buttons
@@ -359,17 +541,26 @@ class SheetSelectionDialog:
     
     def select_all(self):
         """Select all sheets"""
-        for var in self.sheet_vars.values():
-            var.set(True)
-    
+        if self.sheet_listbox is not None:
+            self.sheet_listbox.selection_set(0, tk.END)
+        else:
+            for var in self.sheet_vars.values():
+                var.set(True)
+
     def clear_all(self):
         """Clear all sheet selections"""
-        for var in self.sheet_vars.values():
-            var.set(False)
-    
+        if self.sheet_listbox is not None:
+            self.sheet_listbox.selection_clear(0, tk.END)
+        else:
+            for var in self.sheet_vars.values():
+                var.set(False)
+
     def apply(self):
         """Apply sheet selection"""
-        self.selected_sheets = [sheet for sheet, var in self.sheet_vars.items() if var.get()]
+        if self.sheet_listbox is not None:
+            self.selected_sheets = [self.available_sheets[i] for i in self.sheet_listbox.curselection()]
+        else:
+            self.selected_sheets = [sheet for sheet, var in self.sheet_vars.items() if var.get()]
         
         if not self.selected_sheets:
             messagebox.showwarning("No Selection", "Please select at least one sheet.")
@@ -569,10 +760,11 @@ class PositionMappingDialog:
     
     def select_sheets(self, column_name: str):
         """Open sheet selection dialog for a specific column"""
-        dialog = SheetSelectionDialog(self.dialog, self.template_sheets, 
+        dialog = SheetSelectionDialog(self.dialog, self.template_sheets,
                                      f"Select Sheets for {column_name}")
-        self.dialog.wait_window(dialog.dialog)
-        
+        if dialog.dialog is not None:
+            self.dialog.wait_window(dialog.dialog)
+
         selected = dialog.get_selected_sheets()
         if selected:
             self.selected_sheets_vars[column_name]['selected'] = selected
@@ -665,38 +857,103 @@ class PositionMappingDialog:
 
 class ExcelTableExporter:
     """Handles exporting tables to Excel with position mapping and merged cell support"""
-    
+
+    # Rows per sheet before a table is split across numbered sheets
+    SEGMENT_ROWS = 250_000
+
+    # Shared style singletons - openpyxl compares styles by serialized
+    # value, so reusing one object per role keeps the stylesheet to a
+    # single entry instead of one per styled cell
+    HEADER_FONT = Font(bold=True)
+    HEADER_FILL = PatternFill(start_color="D9E1F2", end_color="D9E1F2", fill_type="solid")
+    CENTER_ALIGN = Alignment(horizontal='center', vertical='center')
+
+    @staticmethod
+    def _sheet_segments(table_data: Dict):
+        """Yield (sheet_title, rows) pairs, splitting oversized tables"""
+        rows = table_data['data']
+        display_name = table_data['display_name']
+        segment = ExcelTableExporter.SEGMENT_ROWS
+
+        if len(rows) <= segment:
+            yield ExcelTableExporter.get_valid_sheet_name(display_name), rows
+            return
+
+        for i in range(0, len(rows), segment):
+            part = i // segment + 1
+            yield (ExcelTableExporter.get_valid_sheet_name(f"{display_name}_{part}"),
+                   rows[i:i + segment])
+
     @staticmethod
     def export_tables_to_excel(tables_data: Dict, output_path: str) -> bool:
         """Export multiple tables to new Excel file"""
+        if HAS_XLSXWRITER:
+            return ExcelTableExporter._export_tables_xlsxwriter(tables_data, output_path)
+
         try:
-            wb = Workbook()
-            
-            # Remove default sheet
-            if wb.sheetnames:
-                wb.remove(wb.active)
-            
-            # Create a sheet for each table
+            # Write-only mode streams rows straight to disk instead of
+            # holding a Cell object per value in RAM (and picks up the
+            # lxml serializer automatically when it is installed)
+            wb = Workbook(write_only=True)
+
+            # Create a sheet for each table (oversized tables span several)
             for table_name, table_data in tables_data.items():
                 if table_data.get('success', False):
-                    # Create sheet with valid name
-                    sheet_name = ExcelTableExporter.get_valid_sheet_name(table_data['display_name'])
-                    ws = wb.create_sheet(title=sheet_name)
-                    
-                    # Add table to sheet
-                    ExcelTableExporter.add_table_to_sheet(ws, table_data)
-            
+                    for sheet_name, rows in ExcelTableExporter._sheet_segments(table_data):
+                        ws = wb.create_sheet(title=sheet_name)
+                        ExcelTableExporter.add_table_to_sheet(ws, {**table_data, 'data': rows})
+
             # Save workbook
             wb.save(output_path)
             logger.info(f"Excel file created: {output_path}")
             return True
-            
+
         except Exception as e:
             logger.error(f"Excel export error: {e}")
             raise
-    
+
     @staticmethod
-    def export_tables_to_template(tables_data: Dict, template_path: str, 
+    def _export_tables_xlsxwriter(tables_data: Dict, output_path: str) -> bool:
+        """Streaming export via xlsxwriter in constant-memory mode"""
+        try:
+            wb = xlsxwriter.Workbook(output_path, {
+                'constant_memory': True,       # flush each row to disk
+                'strings_to_formulas': False,  # no '=...' parsing per cell
+                'strings_to_urls': False,      # no URL detection per cell
+                'default_date_format': 'yyyy-mm-dd hh:mm:ss',
+            })
+            header_fmt = wb.add_format({'bold': True, 'bg_color': '#D9E1F2'})
+
+            # xlsxwriter raises DuplicateWorksheetName where openpyxl
+            # auto-renames, so keep names unique (case-insensitively,
+            # matching Excel's rules) ourselves
+            seen_names = set()
+
+            for table_name, table_data in tables_data.items():
+                if not table_data.get('success', False):
+                    continue
+
+                for sheet_name, rows in ExcelTableExporter._sheet_segments(table_data):
+                    base, n = sheet_name, 1
+                    while sheet_name.lower() in seen_names:
+                        n += 1
+                        sheet_name = f"{base[:28]}_{n}"
+                    seen_names.add(sheet_name.lower())
+                    ws = wb.add_worksheet(sheet_name)
+                    ws.write_row(0, 0, table_data['columns'], header_fmt)
+                    for row_idx, row_data in enumerate(rows, start=1):
+                        ws.write_row(row_idx, 0, row_data)
+
+            wb.close()
+            logger.info(f"Excel file created: {output_path}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Excel export error: {e}")
+            raise
+
+    @staticmethod
+    def export_tables_to_template(tables_data: Dict, template_path: str,
                                 table_configs: Dict[str, TableConfig],
                                 output_path: str,
                                 merge_rules: List[str] = None) -> bool:
@@ -737,13 +994,16 @@ class ExcelTableExporter:
                     continue
                 
                 table_config = table_configs[table_name]
-                
+
+                # Rows are tuples in column order; map names to positions
+                col_index = {c: i for i, c in enumerate(table_data['columns'])}
+
                 # Write individual column mappings
                 for column_name, cell_mapping in table_config.column_mappings.items():
                     # Check if this column exists in the data
-                    if column_name in table_data['columns'] and table_data['data']:
+                    if column_name in col_index and table_data['data']:
                         # Get the value from first row
-                        value = table_data['data'][0].get(column_name, "")
+                        value = table_data['data'][0][col_index[column_name]]
                         
                         # Determine which sheets to write to
                         sheets_to_write = []
@@ -805,13 +1065,12 @@ class ExcelTableExporter:
                             
                             if success:
                                 cell = ws[cell_ref]
-                                cell.font = Font(bold=True)
-                                cell.fill = PatternFill(start_color="D9E1F2", end_color="D9E1F2", fill_type="solid")
+                                cell.font = ExcelTableExporter.HEADER_FONT
+                                cell.fill = ExcelTableExporter.HEADER_FILL
                         
-                        # Write data
+                        # Write data (row tuples share the columns order)
                         for row_idx, row_data in enumerate(table_data['data'], start=1):
-                            for col_idx, col_name in enumerate(table_data['columns'], start=0):
-                                value = row_data.get(col_name, "")
+                            for col_idx, value in enumerate(row_data):
                                 cell_col = start_col_idx + col_idx
                                 cell_row = safe_row + row_idx
                                 cell_ref = f"{get_column_letter(cell_col)}{cell_row}"
@@ -856,7 +1115,7 @@ class ExcelTableExporter:
                     try:
                         ws[top_left_cell] = value
                         # Center alignment for merged cells
-                        ws[top_left_cell].alignment = Alignment(horizontal='center', vertical='center')
+                        ws[top_left_cell].alignment = ExcelTableExporter.CENTER_ALIGN
                         return True
                     except:
                         return False
@@ -903,33 +1162,42 @@ class ExcelTableExporter:
         
         return name[:31]
     
+    # Rows sampled for column auto-sizing; scanning every cell of a big
+    # table costs more than the widths are worth
+    WIDTH_SAMPLE_ROWS = 1000
+
     @staticmethod
     def add_table_to_sheet(ws, table_data: Dict):
-        """Add a table to Excel sheet"""
-        # Write headers
-        for col_idx, col_name in enumerate(table_data['columns'], start=1):
-            cell = ws.cell(row=1, column=col_idx, value=col_name)
-            cell.font = Font(bold=True)
-            cell.fill = PatternFill(start_color="D9E1F2", end_color="D9E1F2", fill_type="solid")
-        
-        # Write data
-        for row_idx, row_data in enumerate(table_data['data'], start=2):
-            for col_idx, col_name in enumerate(table_data['columns'], start=1):
-                value = row_data.get(col_name, '')
-                ws.cell(row=row_idx, column=col_idx, value=value)
-        
-        # Auto-size columns
-        for col in ws.columns:
-            max_length = 0
-            column = col[0].column_letter
-            for cell in col:
-                try:
-                    if cell.value and len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = min(max_length + 2, 50)
-            ws.column_dimensions[column].width = adjusted_width
+        """Add a table to a write-only Excel sheet"""
+        columns = table_data['columns']
+        rows = table_data['data']
+
+        # Column widths must be declared before the first append in
+        # write-only mode; size from the header plus a row sample
+        widths = [len(col) for col in columns]
+        for row_data in rows[:ExcelTableExporter.WIDTH_SAMPLE_ROWS]:
+            for i, value in enumerate(row_data):
+                if value is not None:
+                    length = len(str(value))
+                    if length > widths[i]:
+                        widths[i] = length
+        for i, width in enumerate(widths, start=1):
+            ws.column_dimensions[get_column_letter(i)].width = min(width + 2, 50)
+
+        # Header row - the class-level style singletons are shared by
+        # every header cell of every sheet
+        header = []
+        for col_name in columns:
+            cell = WriteOnlyCell(ws, value=col_name)
+            cell.font = ExcelTableExporter.HEADER_FONT
+            cell.fill = ExcelTableExporter.HEADER_FILL
+            header.append(cell)
+        ws.append(header)
+
+        # Stream data rows - the tuples go to openpyxl as-is, no per-row
+        # rebuild needed now that rows share the columns order
+        for row_data in rows:
+            ws.append(row_data)
 
 # ============================================================================
 # MAIN APPLICATION WITH SHEET SELECTION
@@ -937,23 +1205,40 @@ class ExcelTableExporter:
 
 class MultiTableExporterApp:
     """Main Application"""
-    
+
+    SETTINGS_FILE = 'table_exporter_settings.json'
+
     def __init__(self, root):
         self.root = root
         self.root.title("Excel Table Exporter with Sheet Selection")
         self.root.geometry("1200x800")
-        
+
+        # Screen dimensions are fixed for the app's lifetime; caching them
+        # lets dialogs of known size center without an update_idletasks
+        # layout pass
+        self._sw = root.winfo_screenwidth()
+        self._sh = root.winfo_screenheight()
+
         # Database connection
         self.db = DatabaseManager()
         self.exporter = ExcelTableExporter()
-        
+
+        # Saved settings from previous session
+        self.settings = self.load_settings()
+
         # Variables
-        self.server_var = tk.StringVar(value="MAHESHWAGH\\WINCC")
-        self.database_var = tk.StringVar(value="VPI1")
+        self.server_var = tk.StringVar(value=self.settings.get('server', "MAHESHWAGH\\WINCC"))
+        self.database_var = tk.StringVar(value=self.settings.get('database', "VPI1"))
         
         # Table selection and configuration
         self.selected_tables = []
         self.table_checkboxes = {}
+        # Checkbutton widgets are pooled per table name and re-shown on
+        # refresh - widget creation is the expensive part of a reload
+        self._checkbox_pool = {}
+        # Bumped on every repopulation so stale after_idle chunk chains
+        # can tell they have been superseded
+        self._checkbox_generation = 0
         self.table_configs = {}  # table_name -> TableConfig
         
         # Template
@@ -962,7 +1247,24 @@ class MultiTableExporterApp:
         
         # Merge rules
         self.merge_rules = []
-        
+
+        # Log queue (flushed in batches on the Tk main loop)
+        self.log_queue = deque()
+        self.log_flush_pending = False
+        self._log_lock = threading.Lock()
+
+        # Export-success dialog, built lazily and reused across exports
+        self._success_dialog = None
+
+        # Coalesced status-bar updates (only the latest text is applied)
+        self._pending_status = ""
+        self._status_flush_pending = False
+        self.log_line_count = 1  # widget line numbering starts at 1
+
+        # Set while no export worker is running
+        self.export_done = threading.Event()
+        self.export_done.set()
+
         # Setup UI
         self.setup_ui()
         
@@ -1158,7 +1460,7 @@ class MultiTableExporterApp:
         options_frame.pack(fill='x', pady=(0, 20))
         
         ttk.Label(options_frame, text="Row limit (0 = all):").pack(anchor='w', pady=2)
-        self.row_limit_var = tk.StringVar(value="0")
+        self.row_limit_var = tk.StringVar(value=self.settings.get('row_limit', "0"))
         ttk.Entry(options_frame, textvariable=self.row_limit_var, width=10).pack(anchor='w', pady=2)
         
         # Export buttons
@@ -1185,61 +1487,82 @@ class MultiTableExporterApp:
         self.log_text.tag_configure('error', foreground='red', font=('Consolas', 9, 'bold'))
         self.log_text.tag_configure('info', foreground='blue', font=('Consolas', 9))
         self.log_text.tag_configure('warning', foreground='orange', font=('Consolas', 9))
+
+        # Read-only between flushes - _drain_log re-enables around its
+        # single insert, and Tk skips input-event handling meanwhile
+        self.log_text.configure(state='disabled')
     
+    def set_status(self, text: str):
+        """Update the status bar (coalesced; safe from background threads)"""
+        # Only the newest text matters - intermediate messages from a
+        # burst are stale by the time they would render, so one deferred
+        # config applies the last value instead of one config per call
+        self._pending_status = text
+        if not self._status_flush_pending:
+            self._status_flush_pending = True
+            self.root.after(self.LOG_FLUSH_MS, self._flush_status)
+
+    def _flush_status(self):
+        """Apply the most recent status text on the Tk thread"""
+        self._status_flush_pending = False
+        self.status_bar.config(text=self._pending_status)
+
     def test_connection(self):
         """Test database connection"""
         def test():
-            self.status_bar.config(text="Testing connection...")
-            
+            self.set_status("Testing connection...")
+
             try:
                 success, message = self.db.connect(
                     server=self.server_var.get(),
                     database=self.database_var.get(),
                     use_windows_auth=True
                 )
-                
+
                 if success:
-                    self.status_bar.config(text="Connection test successful")
+                    self.set_status("Connection test successful")
                     self.db.disconnect()
-                    messagebox.showinfo("Connection Test", "✅ Connection successful!")
+                    self.root.after(0, lambda: messagebox.showinfo("Connection Test", "✅ Connection successful!"))
                     self.log("Connection test successful", 'success')
                 else:
-                    self.status_bar.config(text="Connection test failed")
-                    messagebox.showerror("Connection Test", f"❌ Connection failed:\n{message}")
+                    self.set_status("Connection test failed")
+                    self.root.after(0, lambda: messagebox.showerror("Connection Test", f"❌ Connection failed:\n{message}"))
                     self.log(f"Connection test failed: {message}", 'error')
-                    
+
             except Exception as e:
-                self.status_bar.config(text=f"Error: {str(e)}")
-                messagebox.showerror("Connection Test", f"❌ Error during connection test:\n{str(e)}")
-                self.log(f"Connection test error: {str(e)}", 'error')
-        
+                error_msg = str(e)
+                self.set_status(f"Error: {error_msg}")
+                self.root.after(0, lambda: messagebox.showerror("Connection Test", f"❌ Error during connection test:\n{error_msg}"))
+                self.log(f"Connection test error: {error_msg}", 'error')
+
         threading.Thread(target=test, daemon=True).start()
     
     def connect_db(self):
         """Connect to database"""
         def connect():
-            self.status_bar.config(text="Connecting...")
-            
+            self.set_status("Connecting...")
+
             try:
                 success, message = self.db.connect(
                     server=self.server_var.get(),
                     database=self.database_var.get(),
                     use_windows_auth=True
                 )
-                
+
                 if success:
-                    self.status_bar.config(text="Connected successfully")
-                    self.refresh_tables()
+                    self.set_status("Connected successfully")
+                    self.root.after(0, self.refresh_tables)
                     self.log("✅ Database connected successfully", 'success')
                 else:
-                    self.status_bar.config(text=f"Connection failed: {message}")
-                    messagebox.showerror("Connection Error", message)
+                    self.set_status(f"Connection failed: {message}")
+                    self.root.after(0, lambda: messagebox.showerror("Connection Error", message))
                     self.log(f"❌ Connection failed: {message}", 'error')
-                    
+
             except Exception as e:
-                self.status_bar.config(text=f"Error: {str(e)}")
-                messagebox.showerror("Connection Error", f"Error during connection:\n{str(e)}")
-                self.log(f"❌ Connection error: {str(e)}", 'error')
+                error_msg = str(e)
+                self.set_status(f"Error: {error_msg}")
+                self.root.after(0, lambda: messagebox.showerror("Connection Error", f"Error during connection:\n{error_msg}"))
+                self.log(f"❌ Connection error: {error_msg}", 'error')
         
         threading.Thread(target=connect, daemon=True).start()
     
@@ -1262,44 +1585,76 @@ class MultiTableExporterApp:
             return
         
         def refresh():
-            self.status_bar.config(text="Loading tables...")
-            
+            self.set_status("Loading tables...")
+
             try:
-                tables = self.db.get_tables()
-                self.create_table_checkboxes(tables)
-                self.status_bar.config(text=f"Loaded {len(tables)} tables")
-                self.selected_count_label.config(text=f"{len(self.selected_tables)} tables selected")
+                # Explicit refresh is the one action that bypasses the
+                # schema cache
+                tables = self.db.get_tables(refresh=True)
+                # Widget creation must happen on the main loop
+                self.root.after(0, lambda: self.create_table_checkboxes(tables))
+                self.set_status(f"Loaded {len(tables)} tables")
                 self.log(f"✅ Loaded {len(tables)} tables", 'success')
             except Exception as e:
-                self.status_bar.config(text=f"Error loading tables: {str(e)}")
+                self.set_status(f"Error loading tables: {str(e)}")
                 self.log(f"❌ Error loading tables: {str(e)}", 'error')
         
         threading.Thread(target=refresh, daemon=True).start()
     
+    # Checkbuttons created per scheduling slice when populating the
+    # table list - creating hundreds in one callback freezes the UI
+    CHECKBOX_CHUNK = 50
+
     def create_table_checkboxes(self, tables: List[str]):
-        """Create checkboxes for table selection"""
-        # Clear existing checkboxes
+        """Show checkboxes for table selection, in chunks"""
+        # Hide existing checkboxes (widgets stay pooled for reuse)
         self.clear_table_checkboxes()
         self.table_checkboxes.clear()
-        
-        # Create new checkboxes
-        for i, table in enumerate(tables):
-            var = tk.BooleanVar(value=False)
-            self.table_checkboxes[table] = var
-            
-            cb_frame = ttk.Frame(self.checkbox_container)
+
+        # A new population invalidates any chunk chain still draining
+        # from the previous one
+        self._checkbox_generation += 1
+        self.root.after_idle(self._insert_checkbox_chunk, tables, 0,
+                             self._checkbox_generation)
+
+    def _insert_checkbox_chunk(self, tables: List[str], start: int,
+                               generation: int):
+        """Place one chunk of table checkboxes, then yield to the loop"""
+        # A refresh started after this chain was scheduled; let the new
+        # chain own the container
+        if generation != self._checkbox_generation:
+            return
+        for table in tables[start:start + self.CHECKBOX_CHUNK]:
+            pooled = self._checkbox_pool.get(table)
+            if pooled is not None:
+                # Reuse the existing widget pair; just reset and re-show
+                cb_frame, var = pooled
+                var.set(False)
+            else:
+                var = tk.BooleanVar(value=False)
+                cb_frame = ttk.Frame(self.checkbox_container)
+                cb = ttk.Checkbutton(cb_frame, text=table, variable=var,
+                                    command=self.update_selected_count)
+                cb.pack(anchor='w')
+                self._checkbox_pool[table] = (cb_frame, var)
+
+            # Everything was unpacked first, so packing in list order
+            # reproduces the table ordering
             cb_frame.pack(fill='x', padx=5, pady=2)
-            
-            cb = ttk.Checkbutton(cb_frame, text=table, variable=var,
-                                command=self.update_selected_count)
-            cb.pack(anchor='w')
-        
-        self.update_selected_count()
-    
+            self.table_checkboxes[table] = var
+
+        next_start = start + self.CHECKBOX_CHUNK
+        if next_start < len(tables):
+            # Let pending events (redraws, clicks) run between chunks
+            self.root.after_idle(self._insert_checkbox_chunk, tables,
+                                 next_start, generation)
+        else:
+            self.update_selected_count()
+
     def clear_table_checkboxes(self):
-        """Clear all table checkboxes"""
-        for widget in self.checkbox_container.winfo_children():
-            widget.destroy()
+        """Hide all table checkboxes (pooled widgets are kept)"""
+        for cb_frame, _ in self._checkbox_pool.values():
+            cb_frame.pack_forget()
     
     def select_all_tables(self):
         """Select all tables"""
@@ -1485,21 +1840,36 @@ class MultiTableExporterApp:
     def fetch_table_data(self, limit: int = 0) -> Dict:
         """Fetch data for all selected tables"""
         tables_data = {}
-        
+
+        # One metadata round-trip for all tables instead of one per table
+        try:
+            columns_by_table = self.db.get_all_columns(self.selected_tables)
+        except Exception as e:
+            self.log(f"⚠️ Could not prefetch column metadata: {str(e)}", 'warning')
+            columns_by_table = {}
+
+        # Accumulate the summary in the same pass - no extra scans afterwards
+        success_count = 0
+        total_rows = 0
+
         for table in self.selected_tables:
             try:
-                data = self.db.fetch_table_data(table, limit if limit > 0 else None)
+                data = self.db.fetch_table_data(table, limit if limit > 0 else None,
+                                                columns=columns_by_table.get(table))
                 tables_data[table] = data
-                
+
                 if data['success']:
+                    success_count += 1
+                    total_rows += data['row_count']
                     self.log(f"✅ {data['display_name']}: {data['row_count']} rows", 'success')
                 else:
                     self.log(f"❌ {data['display_name']}: {data.get('error', 'Unknown error')}", 'error')
-                    
+
             except Exception as e:
                 tables_data[table] = {'success': False, 'error': str(e)}
                 self.log(f"❌ {table}: {str(e)}", 'error')
-        
+
+        self.log(f"📊 Fetched {total_rows} rows from {success_count}/{len(self.selected_tables)} tables", 'info')
         return tables_data
     
     def export_new_excel(self):
@@ -1507,6 +1877,10 @@ class MultiTableExporterApp:
         if not self.selected_tables:
             messagebox.showwarning("No Selection", "Please select tables first")
             return
+
+        if not self.export_done.is_set():
+            messagebox.showwarning("Export Running", "An export is already in progress")
+            return
         
         # Ask for save location
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -1523,34 +1897,37 @@ class MultiTableExporterApp:
             return
         
         def export():
-            self.status_bar.config(text="Exporting...")
+            self.set_status("Exporting...")
             self.log("Starting export...", 'info')
-            
+
             try:
                 # Get row limit
                 try:
                     row_limit = int(self.row_limit_var.get())
                 except:
                     row_limit = 0
-                
+
                 # Fetch data
                 tables_data = self.fetch_table_data(row_limit)
-                
+
                 # Export to Excel
                 self.exporter.export_tables_to_excel(tables_data, file_path)
-                
-                self.status_bar.config(text="Export completed")
+
+                self.set_status("Export completed")
                 self.log(f"✅ Export completed: {file_path}", 'success')
-                
+
                 # Show success message
                 self.root.after(0, lambda: self.show_export_success(file_path))
-                
+
             except Exception as e:
                 error_msg = str(e)
-                self.status_bar.config(text=f"Export failed: {error_msg}")
+                self.set_status(f"Export failed: {error_msg}")
                 self.log(f"❌ Export failed: {error_msg}", 'error')
                 self.root.after(0, lambda: messagebox.showerror("Export Error", f"Failed to export:\n{error_msg}"))
-        
+            finally:
+                self.export_done.set()
+
+        self.export_done.clear()
         threading.Thread(target=export, daemon=True).start()
     
     def export_to_template(self):
@@ -1563,8 +1940,12 @@ class MultiTableExporterApp:
             messagebox.showwarning("No Template", "Please select a template first")
             return
         
+        if not self.export_done.is_set():
+            messagebox.showwarning("Export Running", "An export is already in progress")
+            return
+
         if not self.table_configs:
-            if not messagebox.askyesno("No Mappings", 
+            if not messagebox.askyesno("No Mappings",
                                       "No position mappings configured. Export anyway?"):
                 return
         
@@ -1590,7 +1971,7 @@ class MultiTableExporterApp:
             return
         
         def export():
-            self.status_bar.config(text="Exporting to template...")
+            self.set_status("Exporting to template...")
             self.log("Starting template export...", 'info')
             
             try:
@@ -1612,15 +1993,15 @@ class MultiTableExporterApp:
                     merge_rules=merge_rules
                 )
                 
-                self.status_bar.config(text="Export completed")
+                self.set_status("Export completed")
                 self.log(f"✅ Template export completed: {file_path}", 'success')
-                
+
                 # Show success message
                 self.root.after(0, lambda: self.show_export_success(file_path))
-                
+
             except Exception as e:
                 error_msg = str(e)
-                self.status_bar.config(text=f"Export failed: {error_msg}")
+                self.set_status(f"Export failed: {error_msg}")
                 self.log(f"❌ Template export failed: {error_msg}", 'error')
                 self.root.after(0, lambda: messagebox.showerror("Export Error", 
                     f"Failed to export template:\n{error_msg}\n\n"
@@ -1628,58 +2009,237 @@ class MultiTableExporterApp:
                     "1. Template file is open in Excel - close it and try again\n"
                     "2. Invalid cell references in mappings\n"
                     "3. File permissions issue"))
-        
+            finally:
+                self.export_done.set()
+
+        self.export_done.clear()
         threading.Thread(target=export, daemon=True).start()
     
     def show_export_success(self, file_path: str):
-        """Show export success dialog"""
-        file_name = os.path.basename(file_path)
-        
+        """Show export success dialog (one cached Toplevel, reused per export)"""
+        # One stat covers the size; one split covers both path pieces.
+        # The button lambdas close over these precomputed values, so the
+        # click handlers do no path work of their own.
+        st = os.stat(file_path)
+        file_dir, file_name = os.path.split(file_path)
+
+        if self._success_dialog is None:
+            self._build_success_dialog()
+
+        self._success_fname_var.set(f"File: {file_name}")
+        # Integer-only "X.Y KB": kb is size>>10, tenths scales the
+        # sub-kilobyte remainder - same display, no float division
+        sz = st.st_size
+        kb = sz >> 10
+        tenths = ((sz & 1023) * 10) >> 10
+        self._success_fsize_var.set(f"Size: {kb}.{tenths} KB")
+
+        # Rebind the open buttons to the current export's paths
+        self._success_open_file_btn.config(
+            command=lambda: [self._open_with_shell(['cmd', '/c', 'start', '', file_path]),
+                             self._hide_success_dialog()])
+        self._success_open_dir_btn.config(
+            command=lambda: [self._open_with_shell(['explorer', file_dir]),
+                             self._hide_success_dialog()])
+
+        dialog = self._success_dialog
+
+        # Center directly from the known 400x250 size and cached screen
+        # dimensions - no forced layout pass needed
+        x = (self._sw - 400) // 2
+        y = (self._sh - 250) // 2
+        dialog.geometry(f"400x250+{x}+{y}")
+
+        dialog.deiconify()
+        dialog.grab_set()
+        dialog.lift()
+        dialog.focus_set()
+
+    def _build_success_dialog(self):
+        """Build the export-success Toplevel once.
+
+        ttk widget construction is the expensive part of showing the
+        dialog, so it is kept hidden between exports and only its label
+        text and button commands change per show.
+        """
         dialog = tk.Toplevel(self.root)
+        dialog.withdraw()
         dialog.title("Export Successful")
         dialog.geometry("400x250")
+        # transient() costs a window-manager round-trip; set it once here
+        # rather than on every show
         dialog.transient(self.root)
-        dialog.grab_set()
-        
-        # Center dialog
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() - dialog.winfo_width()) // 2
-        y = (dialog.winfo_screenheight() - dialog.winfo_height()) // 2
-        dialog.geometry(f"+{x}+{y}")
-        
+        dialog.protocol("WM_DELETE_WINDOW", self._hide_success_dialog)
+
+        # Grid the whole dialog - one column configuration instead of a
+        # pack constraint solve per child, and since the dialog is cached
+        # the layout is resolved once for the app's lifetime
+        dialog.grid_columnconfigure(0, weight=1)
+
         # Success message
-        ttk.Label(dialog, text="✅", font=('Arial', 32), foreground='green').pack(pady=(20, 10))
-        ttk.Label(dialog, text="Excel File Created Successfully!", font=('Arial', 12, 'bold')).pack()
-        
-        # File info
-        file_size = os.path.getsize(file_path) / 1024  # KB
-        ttk.Label(dialog, text=f"File: {file_name}").pack(pady=5)
-        ttk.Label(dialog, text=f"Size: {file_size:.1f} KB").pack(pady=5)
-        
+        ttk.Label(dialog, text="✅", font=('Arial', 32),
+                  foreground='green').grid(row=0, column=0, pady=(20, 10))
+        ttk.Label(dialog, text="Excel File Created Successfully!",
+                  font=('Arial', 12, 'bold')).grid(row=1, column=0)
+
+        # File info (updated per export via the StringVars)
+        self._success_fname_var = tk.StringVar()
+        self._success_fsize_var = tk.StringVar()
+        ttk.Label(dialog, textvariable=self._success_fname_var).grid(row=2, column=0, pady=5)
+        ttk.Label(dialog, textvariable=self._success_fsize_var).grid(row=3, column=0, pady=5)
+
         # Buttons
         btn_frame = ttk.Frame(dialog)
-        btn_frame.pack(pady=20)
-        
-        ttk.Button(btn_frame, text="Open File", 
-                  command=lambda: [os.startfile(file_path), dialog.destroy()],
-                  width=12).pack(side=tk.LEFT, padx=5)
-        ttk.Button(btn_frame, text="Open Folder", 
-                  command=lambda: [os.startfile(os.path.dirname(file_path)), dialog.destroy()],
-                  width=12).pack(side=tk.LEFT, padx=5)
-        ttk.Button(btn_frame, text="OK", 
-                  command=dialog.destroy, width=8).pack(side=tk.RIGHT, padx=5)
-    
+        btn_frame.grid(row=4, column=0, pady=20)
+
+        self._success_open_file_btn = ttk.Button(btn_frame, text="Open File", width=12)
+        self._success_open_file_btn.pack(side=tk.LEFT, padx=5)
+        self._success_open_dir_btn = ttk.Button(btn_frame, text="Open Folder", width=12)
+        self._success_open_dir_btn.pack(side=tk.LEFT, padx=5)
+        ttk.Button(btn_frame, text="OK",
+                  command=self._hide_success_dialog, width=8).pack(side=tk.RIGHT, padx=5)
+
+        self._success_dialog = dialog
+
+    def _hide_success_dialog(self):
+        """Hide the cached success dialog instead of destroying it"""
+        self._success_dialog.grab_release()
+        self._success_dialog.withdraw()
+
+    @staticmethod
+    def _open_with_shell(args: List[str]):
+        """Launch a shell open command without blocking the Tk thread.
+
+        os.startfile talks to the Windows shell synchronously and can
+        stall the mainloop for hundreds of ms; a detached Popen returns
+        immediately, and the daemon thread keeps even the spawn itself
+        off the UI thread.
+        """
+        def _spawn():
+            try:
+                subprocess.Popen(
+                    args,
+                    creationflags=getattr(subprocess, 'DETACHED_PROCESS', 0))
+            except OSError as e:
+                logger.warning(f"Could not launch {args[0]}: {e}")
+
+        threading.Thread(target=_spawn, daemon=True).start()
+
+    # Collection window for a log flush - enough to batch a burst of
+    # messages into one widget update without visible latency
+    LOG_FLUSH_MS = 50
+
+    # Oldest lines are dropped past this point; Text redraws slow down
+    # as content grows, and nobody scrolls back thousands of lines
+    MAX_LOG_LINES = 5000
+
     def log(self, message: str, tag: str = 'info'):
-        """Add message to log"""
-        timestamp = datetime.now().strftime('%H:%M:%S')
-        self.log_text.insert(tk.END, f"[{timestamp}] {message}\n", tag)
+        """Queue a log message (flushed in batches on the main loop).
+
+        Thread-safe entry point: workers only touch the queue and the
+        flush flag here; the widget itself is only ever updated by
+        _drain_log on the Tk thread.
+        """
+        # time.strftime formats straight from a struct_time - cheaper than
+        # building a datetime object for every log line
+        timestamp = time.strftime('%H:%M:%S')
+
+        with self._log_lock:
+            self.log_queue.append((f"[{timestamp}] {message}\n", tag))
+            if self.log_flush_pending:
+                return
+            self.log_flush_pending = True
+
+        # A fixed 50 ms window batches better than after_idle, which
+        # fires per message whenever the event loop is otherwise idle
+        self.root.after(self.LOG_FLUSH_MS, self._drain_log)
+
+    def _drain_log(self):
+        """Flush queued log messages into the log widget in one insert"""
+        with self._log_lock:
+            self.log_flush_pending = False
+
+        if not self.log_queue:
+            return
+
+        # Pop a bounded batch so a message flood cannot stall the UI
+        entries = []
+        while self.log_queue and len(entries) < 200:
+            entries.append(self.log_queue.popleft())
+
+        self.log_text.configure(state='normal')
+        self.log_text.insert(tk.END, ''.join(text for text, _ in entries))
+
+        # Track line numbers ourselves - no index() round-trip per flush
+        line = self.log_line_count
+        for text, tag in entries:
+            next_line = line + text.count('\n')
+            self.log_text.tag_add(tag, f"{line}.0", f"{next_line}.0")
+            line = next_line
+        self.log_line_count = line
+
+        # Trim from the top past MAX_LOG_LINES so redraw cost stays bound
+        # to the viewport, not the session's full history.  The tracked
+        # line count makes this arithmetic - no index() query needed.
+        excess = self.log_line_count - (self.MAX_LOG_LINES + 1)
+        if excess > 0:
+            self.log_text.delete('1.0', f'{excess + 1}.0')
+            self.log_line_count -= excess
+
+        self.log_text.configure(state='disabled')
+
+        # One auto-scroll per flush, not per message
         self.log_text.see(tk.END)
+
+        # More messages arrived while draining - schedule another pass
+        if self.log_queue:
+            with self._log_lock:
+                self.log_flush_pending = True
+            self.root.after_idle(self._drain_log)
     
+    def load_settings(self) -> Dict:
+        """Load saved settings (orjson when available, stdlib json otherwise)"""
+        try:
+            with open(self.SETTINGS_FILE, 'rb') as f:
+                raw = f.read()
+            settings = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+            logger.info(f"Loaded settings from {self.SETTINGS_FILE}")
+            return settings
+        except FileNotFoundError:
+            pass  # first run - nothing saved yet
+        except Exception as e:
+            logger.error(f"Error loading settings: {e}")
+        return {}
+
+    def save_settings(self):
+        """Persist connection and export settings for the next session"""
+        settings = {
+            'server': self.server_var.get(),
+            'database': self.database_var.get(),
+            'row_limit': self.row_limit_var.get(),
+            'template_path': self.template_path,
+            'last_save': datetime.now().isoformat()
+        }
+
+        try:
+            if HAS_ORJSON:
+                payload = orjson.dumps(settings, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(settings, indent=2).encode('utf-8')
+            with open(self.SETTINGS_FILE, 'wb') as f:
+                f.write(payload)
+        except Exception as e:
+            logger.error(f"Error saving settings: {e}")
+
     def on_closing(self):
         """Handle window closing"""
         if messagebox.askokcancel("Quit", "Do you want to quit the application?"):
+            self.save_settings()
             if self.db.connected:
-                self.db.disconnect()
+                # DB teardown can take seconds on a bad network; do it on
+                # a daemon thread so the window closes immediately.  The
+                # driver cleans up the connection at process exit anyway.
+                threading.Thread(target=self.db.disconnect, daemon=True).start()
             self.root.destroy()
 
 # ============================================================================
@@ -1693,13 +2253,11 @@ def main():
     # Create application
     app = MultiTableExporterApp(root)
     
-    # Center window on screen
-    root.update_idletasks()
-    width = root.winfo_width()
-    height = root.winfo_height()
-    x = (root.winfo_screenwidth() // 2) - (width // 2)
-    y = (root.winfo_screenheight() // 2) - (height // 2)
-    root.geometry(f'{width}x{height}+{x}+{y}')
+    # Center window on screen - the requested size is known (1200x800),
+    # so skip the update_idletasks layout pass and place it directly
+    x = (app._sw - 1200) // 2
+    y = (app._sh - 800) // 2
+    root.geometry(f'1200x800+{x}+{y}')
     
     # Start main loop
     root.mainloop()